@@ -29,7 +29,16 @@ from dataclasses import dataclass, field
 from collections import deque
 from enum import Enum
 
-from schwab_0dte_bot import SchwabClient, OptionsConfig
+from schwab_0dte_bot import (
+    SchwabClient,
+    OptionsConfig,
+    _format_cents,
+    _hm_to_minute,
+    _json_dumps,
+    _read_json,
+    _to_cents,
+    order_poll_delay
+)
 from schwab_config_manager import SchwabConfigManager
 from momentum_scanner import MomentumScanner, ScannerConfig, GapCandidate
 
@@ -191,41 +200,27 @@ class MomentumSchwabClient(SchwabClient):
         """
         await self._ensure_valid_token()
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
+        url = self._url_orders
 
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}/orders"
-
-        order_data = {
-            "orderType": order_type,
-            "session": "NORMAL",
-            "duration": "DAY",
-            "orderStrategyType": "SINGLE",
-            "orderLegCollection": [
-                {
-                    "instruction": instruction,
-                    "quantity": quantity,
-                    "instrument": {
-                        "symbol": symbol,
-                        "assetType": "EQUITY"
-                    }
-                }
-            ]
-        }
+        order_data = self._order_template.copy()
+        order_data["orderType"] = order_type
+        order_data["orderLegCollection"] = [{
+            "instruction": instruction,
+            "quantity": quantity,
+            "instrument": {"symbol": symbol, "assetType": "EQUITY"}
+        }]
 
         if order_type == "LIMIT" and limit_price is not None:
-            order_data["price"] = str(round(limit_price, 2))
+            order_data["price"] = _format_cents(_to_cents(limit_price))
 
         start_time = time.perf_counter()
 
-        async with self.session.post(url, headers=headers, json=order_data) as resp:
+        async with self.session.post(url, headers=self._json_headers, data=_json_dumps(order_data)) as resp:
             latency = (time.perf_counter() - start_time) * 1000
 
             if resp.status in [200, 201]:
                 location = resp.headers.get("Location", "")
-                order_id = location.split("/")[-1] if location else ""
+                order_id = location.rpartition("/")[2]
                 logger.info(
                     f"Order placed in {latency:.0f}ms: {instruction} {quantity}x {symbol} "
                     f"@ ${limit_price:.2f if limit_price else 'MKT'}"
@@ -239,14 +234,13 @@ class MomentumSchwabClient(SchwabClient):
     async def get_quote(self, symbol: str) -> Optional[Dict]:
         """Get real-time quote for a single symbol"""
         await self._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        url = f"{self.config.api_base}/marketdata/v1/quotes"
+        url = self._url_quotes
         params = {"symbols": symbol, "indicative": "true"}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 if symbol in data:
                     return data[symbol].get("quote", {})
         return None
@@ -254,15 +248,14 @@ class MomentumSchwabClient(SchwabClient):
     async def get_quotes_batch(self, symbols: List[str]) -> Dict[str, Dict]:
         """Get quotes for multiple symbols"""
         await self._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        url = f"{self.config.api_base}/marketdata/v1/quotes"
+        url = self._url_quotes
         params = {"symbols": ",".join(symbols), "indicative": "true"}
 
         results = {}
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 for sym in symbols:
                     if sym in data:
                         results[sym] = data[sym].get("quote", {})
@@ -278,7 +271,6 @@ class MomentumSchwabClient(SchwabClient):
         Returns list of candles: {open, high, low, close, volume, datetime}
         """
         await self._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.access_token}"}
 
         url = f"{self.config.api_base}/marketdata/v1/pricehistory"
         params = {
@@ -290,9 +282,9 @@ class MomentumSchwabClient(SchwabClient):
             "needExtendedHoursData": str(extended).lower()
         }
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 return data.get("candles", [])
 
         return []
@@ -300,14 +292,13 @@ class MomentumSchwabClient(SchwabClient):
     async def get_equity_positions(self) -> List[Dict]:
         """Get current equity (stock) positions"""
         await self._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}"
+        url = self._url_account
         params = {"fields": "positions"}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 positions = data.get("securitiesAccount", {}).get("positions", [])
                 return [p for p in positions if p.get("instrument", {}).get("assetType") == "EQUITY"]
         return []
@@ -318,13 +309,12 @@ class MomentumSchwabClient(SchwabClient):
         Returns: (settled_cash, total_cash)
         """
         await self._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.access_token}"}
 
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}"
+        url = self._url_account
 
-        async with self.session.get(url, headers=headers) as resp:
+        async with self.session.get(url) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 balances = data.get("securitiesAccount", {}).get("currentBalances", {})
 
                 total = float(balances.get("cashBalance", 0))
@@ -440,29 +430,29 @@ class MomentumScalpStrategy:
 
     # ── Time Checks ──
 
-    def _current_time_str(self) -> str:
-        return datetime.now().strftime("%H:%M")
+    def _local_now(self) -> Tuple[int, int]:
+        """(weekday, minutes since midnight) from a single clock read"""
+        local = time.localtime()
+        return local.tm_wday, local.tm_hour * 60 + local.tm_min
 
     def _is_trading_hours(self) -> bool:
-        now = datetime.now()
-        if now.weekday() >= 5:
+        weekday, minute = self._local_now()
+        if weekday >= 5:
             return False
-        t = self._current_time_str()
-        return self.config.trading_start <= t <= self.config.trading_end
+        return _hm_to_minute(self.config.trading_start) <= minute <= _hm_to_minute(self.config.trading_end)
 
     def _is_market_open(self) -> bool:
-        now = datetime.now()
-        if now.weekday() >= 5:
+        weekday, minute = self._local_now()
+        if weekday >= 5:
             return False
-        t = self._current_time_str()
-        return "09:30" <= t <= "16:00"
+        return _hm_to_minute("09:30") <= minute <= _hm_to_minute("16:00")
 
     def _can_enter_new_trade(self) -> bool:
         """Check all conditions for new entry"""
-        t = self._current_time_str()
+        _, minute = self._local_now()
 
         # Time window
-        if t > self.config.no_new_entries_after:
+        if minute > _hm_to_minute(self.config.no_new_entries_after):
             return False
 
         # Trade count
@@ -762,7 +752,9 @@ class MomentumScalpStrategy:
                 return None
 
             # Wait for fill
-            for _ in range(30):  # 3 seconds
+            deadline = time.monotonic() + 3.0
+            poll_count = 0
+            while (remaining := deadline - time.monotonic()) > 0:
                 status = await self.client.get_order_status(order_id)
                 if status:
                     s = status.get("status")
@@ -771,7 +763,8 @@ class MomentumScalpStrategy:
                         return {"orderId": order_id, "filled": True, "fill_price": fill}
                     elif s in ["CANCELED", "REJECTED", "EXPIRED"]:
                         break
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(min(order_poll_delay(poll_count), remaining))
+                poll_count += 1
 
             # Cancel and retry with more aggressive price
             await self.client.cancel_order(order_id)
@@ -855,7 +848,8 @@ class MomentumScalpStrategy:
 
         # ── EOD Exit ──
         if not should_exit:
-            if self._current_time_str() >= self.config.eod_exit_time:
+            _, minute = self._local_now()
+            if minute >= _hm_to_minute(self.config.eod_exit_time):
                 should_exit = True
                 exit_reason = "EOD EXIT"
 
@@ -952,13 +946,13 @@ class MomentumScalpStrategy:
         logger.info(f"  Trading window: {self.config.trading_start} - {self.config.no_new_entries_after}")
         logger.info("=" * 60)
 
-        last_candle_update = 0
-        last_heartbeat = 0
+        last_candle_update = float("-inf")
+        last_heartbeat = float("-inf")
         candle_interval = self.config.candle_interval_seconds
 
         while self.running:
             try:
-                now = time.time()
+                now = time.monotonic()
 
                 # Heartbeat
                 if now - last_heartbeat >= 300:
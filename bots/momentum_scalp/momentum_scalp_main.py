@@ -378,7 +378,7 @@ def setup_signal_handlers(app: MomentumScalpApp, loop: asyncio.AbstractEventLoop
         try:
             loop.add_signal_handler(sig, handler)
         except NotImplementedError:
-            signal.signal(sig, lambda s, f: handler())
+            signal.signal(sig, lambda s, f: loop.call_soon_threadsafe(handler))
 
 
 async def main_async(args):
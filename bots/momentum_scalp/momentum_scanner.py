@@ -25,6 +25,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+from schwab_0dte_bot import _read_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -221,7 +223,6 @@ class MomentumScanner:
         """Get top gainers from Schwab movers endpoint"""
         await self.client._ensure_valid_token()
 
-        headers = {"Authorization": f"Bearer {self.client.access_token}"}
         candidates = []
 
         # Scan both NASDAQ and NYSE
@@ -233,9 +234,9 @@ class MomentumScanner:
             }
 
             try:
-                async with self.client.session.get(url, headers=headers, params=params) as resp:
+                async with self.client.session.get(url, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await _read_json(resp)
                         screeners = data.get("screeners", [])
 
                         for item in screeners:
@@ -286,7 +287,6 @@ class MomentumScanner:
             return []
 
         await self.client._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.client.access_token}"}
 
         url = f"{self.config.api_base}/marketdata/v1/quotes"
         params = {
@@ -297,9 +297,9 @@ class MomentumScanner:
         candidates = []
 
         try:
-            async with self.client.session.get(url, headers=headers, params=params) as resp:
+            async with self.client.session.get(url, params=params) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await _read_json(resp)
 
                     for symbol in self.manual_tickers:
                         if symbol not in data:
@@ -346,7 +346,6 @@ class MomentumScanner:
 
         # Batch quote (Schwab allows up to ~200 symbols)
         await self.client._ensure_valid_token()
-        headers = {"Authorization": f"Bearer {self.client.access_token}"}
 
         # Chunk into batches of 50
         enriched = {c.symbol: c for c in candidates}
@@ -357,9 +356,9 @@ class MomentumScanner:
             params = {"symbols": ",".join(chunk), "indicative": "true"}
 
             try:
-                async with self.client.session.get(url, headers=headers, params=params) as resp:
+                async with self.client.session.get(url, params=params) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await _read_json(resp)
 
                         for sym in chunk:
                             if sym not in data:
@@ -401,11 +400,14 @@ class MomentumScanner:
         symbols = [c.symbol for c in candidates]
         logger.info(f"🔍 Checking news catalysts for {len(symbols)} tickers...")
 
-        # Fetch news for all candidates concurrently
-        tasks = [self._fetch_news_for_symbol(c) for c in candidates]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Fetch news for all candidates concurrently over one pooled session
+        # (connections to the feed hosts are reused across symbols)
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [self._fetch_news_for_symbol(session, c) for c in candidates]
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    async def _fetch_news_for_symbol(self, candidate: GapCandidate):
+    async def _fetch_news_for_symbol(self, session: aiohttp.ClientSession, candidate: GapCandidate):
         """Fetch recent news for a single symbol from multiple sources"""
         symbol = candidate.symbol
 
@@ -417,7 +419,7 @@ class MomentumScanner:
 
         for fetch_fn in sources:
             try:
-                headline = await fetch_fn(symbol)
+                headline = await fetch_fn(session, symbol)
                 if headline:
                     candidate.catalyst = headline
                     logger.info(f"  📰 {symbol}: {headline[:80]}")
@@ -428,58 +430,57 @@ class MomentumScanner:
 
         logger.debug(f"  ⚠️  {symbol}: No catalyst found")
 
-    async def _fetch_yahoo_news(self, symbol: str) -> Optional[str]:
+    async def _fetch_yahoo_news(self, session: aiohttp.ClientSession, symbol: str) -> Optional[str]:
         """
         Fetch latest news headline from Yahoo Finance.
         Uses the RSS feed (no API key required).
         """
         url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                if resp.status != 200:
-                    return None
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+            if resp.status != 200:
+                return None
+
+            text = await resp.text()
 
-                text = await resp.text()
+            # Parse RSS XML for items
+            # Simple regex parsing to avoid xml dependency
+            items = re.findall(
+                r'<item>.*?<title><!\[CDATA\[(.*?)\]\]></title>.*?<pubDate>(.*?)</pubDate>',
+                text, re.DOTALL
+            )
 
-                # Parse RSS XML for items
-                # Simple regex parsing to avoid xml dependency
+            if not items:
+                # Try without CDATA wrapper
                 items = re.findall(
-                    r'<item>.*?<title><!\[CDATA\[(.*?)\]\]></title>.*?<pubDate>(.*?)</pubDate>',
+                    r'<item>.*?<title>(.*?)</title>.*?<pubDate>(.*?)</pubDate>',
                     text, re.DOTALL
                 )
 
-                if not items:
-                    # Try without CDATA wrapper
-                    items = re.findall(
-                        r'<item>.*?<title>(.*?)</title>.*?<pubDate>(.*?)</pubDate>',
-                        text, re.DOTALL
-                    )
+            if not items:
+                return None
 
-                if not items:
-                    return None
+            # Check recency and keyword match
+            cutoff = datetime.utcnow() - timedelta(hours=self.config.catalyst_lookback_hours)
 
-                # Check recency and keyword match
-                cutoff = datetime.utcnow() - timedelta(hours=self.config.catalyst_lookback_hours)
+            for title, pub_date in items:
+                title = title.strip()
 
-                for title, pub_date in items:
-                    title = title.strip()
+                # Check if headline contains catalyst keywords
+                title_lower = title.lower()
+                has_keyword = any(kw in title_lower for kw in self.config.catalyst_keywords)
 
-                    # Check if headline contains catalyst keywords
-                    title_lower = title.lower()
-                    has_keyword = any(kw in title_lower for kw in self.config.catalyst_keywords)
-
-                    if has_keyword:
-                        return title
+                if has_keyword:
+                    return title
 
-                # If no keyword match, return most recent headline anyway
-                # (the gap itself is unusual and any news is worth noting)
-                if items:
-                    return items[0][0].strip()
+            # If no keyword match, return most recent headline anyway
+            # (the gap itself is unusual and any news is worth noting)
+            if items:
+                return items[0][0].strip()
 
         return None
 
-    async def _fetch_google_news(self, symbol: str) -> Optional[str]:
+    async def _fetch_google_news(self, session: aiohttp.ClientSession, symbol: str) -> Optional[str]:
         """
         Fetch latest news from Google News RSS (fallback).
         """
@@ -487,42 +488,41 @@ class MomentumScanner:
         query = f"{symbol}+stock"
         url = f"https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=5),
-                headers={"User-Agent": "Mozilla/5.0"}
-            ) as resp:
-                if resp.status != 200:
-                    return None
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=5),
+            headers={"User-Agent": "Mozilla/5.0"}
+        ) as resp:
+            if resp.status != 200:
+                return None
 
-                text = await resp.text()
+            text = await resp.text()
 
-                # Parse RSS
-                items = re.findall(
-                    r'<item>.*?<title>(.*?)</title>.*?<pubDate>(.*?)</pubDate>',
-                    text, re.DOTALL
-                )
-
-                if not items:
-                    return None
+            # Parse RSS
+            items = re.findall(
+                r'<item>.*?<title>(.*?)</title>.*?<pubDate>(.*?)</pubDate>',
+                text, re.DOTALL
+            )
 
-                # Return first headline that mentions the symbol
-                for title, pub_date in items[:5]:
-                    title = title.strip()
-                    # Clean HTML entities
-                    title = title.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
-                    title = title.replace("&#39;", "'").replace("&quot;", '"')
+            if not items:
+                return None
 
-                    if symbol.upper() in title.upper():
-                        return title
+            # Return first headline that mentions the symbol
+            for title, pub_date in items[:5]:
+                title = title.strip()
+                # Clean HTML entities
+                title = title.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
+                title = title.replace("&#39;", "'").replace("&quot;", '"')
 
-                # Return first headline even if symbol not in title
-                if items:
-                    title = items[0][0].strip()
-                    title = title.replace("&amp;", "&").replace("&#39;", "'")
+                if symbol.upper() in title.upper():
                     return title
 
+            # Return first headline even if symbol not in title
+            if items:
+                title = items[0][0].strip()
+                title = title.replace("&amp;", "&").replace("&#39;", "'")
+                return title
+
         return None
 
     # ── Filtering ──────────────────────────────────────────────────────────────
@@ -14,6 +14,8 @@ Key Features:
 import asyncio
 import aiohttp
 import json
+import math
+import numpy as np
 import time
 import logging
 import base64
@@ -21,11 +23,32 @@ import hashlib
 import secrets
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from collections import deque
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from enum import Enum
 from urllib.parse import urlencode
 
+# Use orjson for API payloads when available (much faster on option chains)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Numba JIT for the per-tick signal kernel when available
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in so kernels run as plain Python without numba"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +57,176 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of SPY snapshots kept in the strategy's price ring buffer
+PRICE_HISTORY_SIZE = 1000
+
+# Seconds between "[Heartbeat]" status lines from the trading loop
+HEARTBEAT_INTERVAL = 300
+
+# Trading loop cadence (50ms for options)
+POLL_INTERVAL = 0.05
+
+# REST order-status polling: start at 50ms, grow 1.8x per poll, cap at 300ms
+ORDER_POLL_INITIAL = 0.05
+ORDER_POLL_BACKOFF = 1.8
+ORDER_POLL_MAX = 0.3
+
+# The background refresher renews the access token this long before
+# token_expiry, which itself sits 60s ahead of the real expiry (seconds)
+TOKEN_REFRESH_LEAD = 60.0
+
+# Longest wait between streamer reconnect attempts (seconds)
+STREAM_RECONNECT_MAX_DELAY = 30.0
+
+# With quotes streaming, fall back to one REST quote after this long without
+# an update (seconds)
+QUOTE_STREAM_TIMEOUT = 1.0
+
+# Streamer LEVELONE field ids: equities 1=bid 2=ask 3=last 8=volume
+LEVELONE_EQUITY_FIELDS = "0,1,2,3,8"
+# Option field id -> OptionContract attribute
+LEVELONE_OPTION_FIELDS = {
+    "2": "bid", "3": "ask", "4": "last", "8": "volume", "9": "open_interest",
+    "28": "delta", "29": "gamma", "30": "theta", "31": "vega"
+}
+
+# 0DTE contracts expire at the 16:00 close; positions are flattened at 15:55
+MARKET_CLOSE_SECOND = 16 * 3600
+EOD_EXIT_HOUR, EOD_EXIT_MINUTE = 15, 55
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+
+
+@njit(cache=True)
+def _momentum_direction(time_diff: float, price_diff: float,
+                        time_window: float, min_move: float) -> int:
+    """Return +1 (bullish), -1 (bearish) or 0 for a move from the reference point"""
+    if time_diff <= time_window and abs(price_diff) >= min_move:
+        return 1 if price_diff > 0 else -1
+    return 0
+
+
+@njit(cache=True)
+def _trailing_stop_step(current_price: float, entry_price: float,
+                        high_water_mark: float, stop_price: float, active: bool,
+                        activation_percent: float, trail_multiplier: float):
+    """
+    Advance the trailing stop by one option-price tick
+    trail_multiplier is 1 - trailing_stop_percent / 100, precomputed by the
+    caller. Returns (should_exit, high_water_mark, stop_price, active, raised);
+    the tick that activates the stop never exits on the same tick.
+    """
+    if not active:
+        if (current_price - entry_price) / entry_price * 100 >= activation_percent:
+            return False, current_price, current_price * trail_multiplier, True, False
+        return False, high_water_mark, stop_price, False, False
+
+    # Ratchet the stop up with the high water mark, never down
+    raised = False
+    if current_price > high_water_mark:
+        high_water_mark = current_price
+        new_stop = current_price * trail_multiplier
+        if new_stop > stop_price:
+            stop_price = new_stop
+            raised = True
+
+    return current_price <= stop_price, high_water_mark, stop_price, True, raised
+
+
+@lru_cache(maxsize=64)
+def _hm_to_minute(hhmm: str) -> int:
+    """Convert an "HH:MM" string to minutes since midnight"""
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _to_cents(price: float) -> int:
+    """Convert a dollar price to whole cents, rounding half up (never negative)"""
+    # The epsilon absorbs binary error so 1.005 rounds to 101, not 100
+    return max(int(price * 100 + 0.5 + 1e-9), 0)
+
+
+def _format_cents(cents: int) -> str:
+    """Format whole cents as an order price string (210 -> "2.10")"""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _find_order_id(message: Dict) -> Optional[str]:
+    """Pull the Schwab order id out of an ACCT_ACTIVITY message body"""
+    for key in ("SchwabOrderID", "OrderID", "orderId"):
+        if key in message:
+            return str(message[key])
+    return None
+
+
+async def _read_json(resp: aiohttp.ClientResponse):
+    """Decode a JSON response body with the fastest available parser"""
+    return _json_loads(await resp.read())
+
+
+@lru_cache(maxsize=4096)
+def _bs_delta(spot: float, strike: float, seconds_to_expiry: int,
+              sigma: float, rate: float, is_call: bool) -> float:
+    """
+    Black-Scholes delta via math.erf
+    Callers quantize spot to cents and time to whole seconds so repeated
+    evaluations in the chase loop hit the cache.
+    """
+    t = seconds_to_expiry / SECONDS_PER_YEAR
+    if t <= 0 or sigma <= 0 or spot <= 0 or strike <= 0:
+        # At expiry delta collapses to 0 or +/-1
+        if is_call:
+            return 1.0 if spot > strike else 0.0
+        return -1.0 if spot < strike else 0.0
+
+    d1 = (math.log(spot / strike) + (rate + 0.5 * sigma * sigma) * t) / (sigma * math.sqrt(t))
+    nd1 = 0.5 * (1.0 + math.erf(d1 / math.sqrt(2.0)))
+    return nd1 if is_call else nd1 - 1.0
+
+
+def _eod_exit_times(now: float) -> Tuple[float, float]:
+    """Epoch of today's end-of-day exit and of the next local midnight"""
+    local = time.localtime(now)
+    day = (local.tm_year, local.tm_mon, local.tm_mday)
+    exit_at = time.mktime(day + (EOD_EXIT_HOUR, EOD_EXIT_MINUTE, 0, 0, 0, -1))
+    next_midnight = time.mktime((day[0], day[1], day[2] + 1, 0, 0, 0, 0, 0, -1))
+    return exit_at, next_midnight
+
+
+def _seconds_to_close() -> int:
+    """Whole seconds until today's 16:00 expiration (0 after the close)"""
+    local = time.localtime()
+    now = local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec
+    return max(MARKET_CLOSE_SECOND - now, 0)
+
+
+async def sleep_until_next_tick(next_tick: float, interval: float = POLL_INTERVAL) -> float:
+    """
+    Sleep until the next fixed-cadence deadline and return it
+    If the loop overran, skip the missed ticks instead of bunching them up.
+    """
+    next_tick += interval
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        await asyncio.sleep(delay)
+        return next_tick
+    return time.monotonic()
+
+
+def order_poll_delay(poll_count: int) -> float:
+    """Delay before the next order-status poll (fills rarely land in the first 200ms)"""
+    return min(ORDER_POLL_MAX, ORDER_POLL_INITIAL * ORDER_POLL_BACKOFF ** poll_count)
+
+
+def install_eager_task_factory():
+    """
+    Run new tasks eagerly on the current loop (Python 3.12+)
+    Coroutines that finish without suspending (cached token, cached chain)
+    then skip a trip through the scheduler. No-op on older Pythons.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
+
 
 class OptionType(Enum):
     CALL = "CALL"
@@ -62,6 +255,14 @@ class OptionsConfig:
     min_volume: int = 500  # Minimum volume for liquidity
     min_open_interest: int = 1000  # Minimum OI for liquidity
 
+    # Contract scoring (lower is better): |delta - target| + spread_weight * spread%
+    # minus a volume bonus of volume / volume_bonus_scale, capped at max_volume_bonus
+    spread_weight: float = 2.0  # Weight spread heavily
+    volume_bonus_scale: float = 10000
+    max_volume_bonus: float = 0.1
+    # Only score the N strikes closest to spot (0 = score the whole chain)
+    candidate_strikes: int = 20
+
     # Risk management - WIDENED for slippage reality
     stop_loss_percent: float = 35.0  # INCREASED from 30 - wider to avoid slippage-triggered stops
     take_profit_percent: float = 60.0  # INCREASED from 50 - need higher target to overcome spread
@@ -87,11 +288,29 @@ class OptionsConfig:
     # Underlying
     symbol: str = "SPY"
 
+    # REST quote polling cadence (seconds): fast while managing a position,
+    # slower while only watching for a signal. Streamed quotes skip both.
+    poll_interval_active: float = 0.05
+    poll_interval_idle: float = 0.25
+
+    # Used for Black-Scholes deltas when the chain omits Greeks
+    risk_free_rate: float = 0.05
+
+    # Market data caching (milliseconds). The quote TTL stays under the 50ms
+    # poll so every tick sees a fresh SPY price; it only coalesces callers.
+    quote_cache_ms: int = 40
+    chain_cache_ms: int = 500
+
     # Schwab API
     api_base: str = "https://api.schwabapi.com"
     auth_url: str = "https://api.schwabapi.com/v1/oauth/authorize"
     token_url: str = "https://api.schwabapi.com/v1/oauth/token"
 
+    def __post_init__(self):
+        # Trading window as minutes since midnight for integer comparisons
+        self.no_trade_before_minute = _hm_to_minute(self.no_trade_before)
+        self.no_trade_after_minute = _hm_to_minute(self.no_trade_after)
+
 
 @dataclass
 class OptionContract:
@@ -126,6 +345,102 @@ class OptionContract:
         return float('inf')
 
 
+def _parse_option_json(opt_data: Dict, option_type: OptionType, underlying: str) -> OptionContract:
+    """Build an OptionContract from one Schwab chain entry"""
+    return OptionContract(
+        symbol=opt_data.get("symbol", ""),
+        underlying=underlying,
+        option_type=option_type,
+        strike=float(opt_data.get("strikePrice", 0)),
+        expiration=date.today(),  # 0DTE
+        bid=float(opt_data.get("bid", 0)),
+        ask=float(opt_data.get("ask", 0)),
+        last=float(opt_data.get("last", 0)),
+        delta=float(opt_data.get("delta", 0)),
+        gamma=float(opt_data.get("gamma", 0)),
+        theta=float(opt_data.get("theta", 0)),
+        vega=float(opt_data.get("vega", 0)),
+        volume=int(opt_data.get("totalVolume", 0)),
+        open_interest=int(opt_data.get("openInterest", 0))
+    )
+
+
+@dataclass
+class OptionChainArrays:
+    """
+    Column-wise (SoA) view of an option chain for vectorized scoring
+    Row i of every array describes options[i], the raw Schwab JSON entry.
+    OptionContract objects are only built for rows that are asked for.
+    """
+    options: List[Dict]
+    underlying: str
+    is_call: np.ndarray
+    bid: np.ndarray
+    ask: np.ndarray
+    delta: np.ndarray
+    strike: np.ndarray
+    volatility: np.ndarray
+    volume: np.ndarray
+    open_interest: np.ndarray
+    _contracts: Optional[List[OptionContract]] = field(default=None, repr=False)
+    _by_symbol: Optional[Dict[str, int]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_chain_json(cls, data: Dict, underlying: str) -> "OptionChainArrays":
+        """Walk a /marketdata/v1/chains response once, calls then puts"""
+        options: List[Dict] = []
+        for strikes in data.get("callExpDateMap", {}).values():
+            for entries in strikes.values():
+                options.extend(entries)
+        n_calls = len(options)
+        for strikes in data.get("putExpDateMap", {}).values():
+            for entries in strikes.values():
+                options.extend(entries)
+
+        n = len(options)
+        is_call = np.zeros(n, dtype=bool)
+        is_call[:n_calls] = True
+
+        def column(key: str, default: float = 0.0) -> np.ndarray:
+            return np.fromiter((opt.get(key, default) for opt in options), dtype=np.float64, count=n)
+
+        return cls(
+            options=options,
+            underlying=underlying,
+            is_call=is_call,
+            bid=column("bid"),
+            ask=column("ask"),
+            delta=column("delta", np.nan),
+            strike=column("strikePrice"),
+            volatility=column("volatility"),
+            volume=column("totalVolume"),
+            open_interest=column("openInterest")
+        )
+
+    def contract(self, i: int) -> OptionContract:
+        """Materialize a single row as an OptionContract"""
+        option_type = OptionType.CALL if self.is_call[i] else OptionType.PUT
+        return _parse_option_json(self.options[i], option_type, self.underlying)
+
+    def find(self, occ_symbol: str) -> Optional[OptionContract]:
+        """Look up a contract by OCC symbol (index built once per chain)"""
+        if self._by_symbol is None:
+            self._by_symbol = {opt.get("symbol", ""): i for i, opt in enumerate(self.options)}
+        i = self._by_symbol.get(occ_symbol)
+        if i is None:
+            return None
+        if self._contracts is not None:
+            return self._contracts[i]
+        return self.contract(i)
+
+    @property
+    def contracts(self) -> List[OptionContract]:
+        """All rows as OptionContract objects (built once, on first use)"""
+        if self._contracts is None:
+            self._contracts = [self.contract(i) for i in range(len(self.options))]
+        return self._contracts
+
+
 @dataclass
 class PriceSnapshot:
     """SPY price snapshot"""
@@ -136,6 +451,137 @@ class PriceSnapshot:
     volume: int = 0
 
 
+def nearest_strikes(chain: OptionChainArrays, idx: np.ndarray, spot: float, n: int) -> np.ndarray:
+    """Narrow chain rows `idx` to the `n` strikes closest to `spot`, keeping chain order"""
+    if n <= 0 or idx.size <= n:
+        return idx
+    distance = np.abs(chain.strike[idx] - spot)
+    return np.sort(idx[np.argpartition(distance, n - 1)[:n]])
+
+
+def rank_contracts(chain: OptionChainArrays, idx: np.ndarray, delta: np.ndarray,
+                   abs_target_delta: float, config) -> Tuple[Optional[int], Dict[str, int]]:
+    """
+    Apply the slippage filters to chain rows `idx` and score the survivors
+    (lower is better). `delta` is aligned with `idx` and compared by magnitude,
+    so calls and puts share one positive target. `config` supplies the
+    min_option_price / max_bid_ask_spread / min_volume / min_open_interest
+    thresholds and the spread_weight / volume_bonus_scale / max_volume_bonus
+    score weights. Returns the winning chain row (None if nothing passes) and
+    how many rows each filter rejected.
+    """
+    bid = chain.bid[idx]
+    ask = chain.ask[idx]
+    volume = chain.volume[idx]
+    open_interest = chain.open_interest[idx]
+
+    # Enhanced slippage-aware filtering, applied in order so each
+    # rejection is attributed to the first filter it fails
+    mid = (bid + ask) * 0.5
+    with np.errstate(divide='ignore', invalid='ignore'):
+        spread_pct = np.where(mid > 0, (ask - bid) / mid, np.inf)
+
+    remaining = (bid > 0) & (ask > 0)
+    rejection_reasons = {"no_quote": int(idx.size - np.count_nonzero(remaining))}
+    for reason, passed in (
+        # SLIPPAGE FILTER 1: Minimum premium (spread is less % impact)
+        ("low_premium", mid >= config.min_option_price),
+        # SLIPPAGE FILTER 2: Tight spread requirement
+        ("wide_spread", spread_pct <= config.max_bid_ask_spread),
+        # SLIPPAGE FILTER 3: Minimum volume for liquidity
+        ("low_volume", volume >= config.min_volume),
+        # SLIPPAGE FILTER 4: Minimum open interest
+        ("low_oi", open_interest >= config.min_open_interest),
+    ):
+        rejection_reasons[reason] = int(np.count_nonzero(remaining & ~passed))
+        remaining &= passed
+
+    if not remaining.any():
+        return None, rejection_reasons
+
+    # Calculate scores (lower is better)
+    delta_score = np.abs(np.abs(delta) - abs_target_delta)
+    spread_score = spread_pct * config.spread_weight
+
+    # Bonus for higher volume (better fills)
+    volume_bonus = -np.minimum(volume / config.volume_bonus_scale, config.max_volume_bonus)
+
+    # Combined score; rejected (or unscorable) contracts can never win
+    score = delta_score + spread_score + volume_bonus
+    score[~remaining | np.isnan(score)] = np.inf
+
+    best = int(np.argmin(score))
+    if not np.isfinite(score[best]):
+        return None, rejection_reasons
+    return int(idx[best]), rejection_reasons
+
+
+class PriceHistory:
+    """
+    Fixed-size ring of recent quote snapshots stored as NumPy columns
+    Each slot is written twice (i and i + capacity) so the newest `capacity`
+    rows are always one contiguous, oldest-first view.
+    """
+
+    def __init__(self, capacity: int = PRICE_HISTORY_SIZE):
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._prices = np.zeros(2 * capacity, dtype=np.float64)
+        self._bids = np.zeros(2 * capacity, dtype=np.float64)
+        self._asks = np.zeros(2 * capacity, dtype=np.float64)
+        self._writes = 0
+
+    def __len__(self) -> int:
+        return min(self._writes, self.capacity)
+
+    def push(self, snapshot: PriceSnapshot):
+        pos = self._writes % self.capacity
+        mirror = pos + self.capacity
+        self._timestamps[pos] = self._timestamps[mirror] = snapshot.timestamp
+        self._prices[pos] = self._prices[mirror] = snapshot.price
+        self._bids[pos] = self._bids[mirror] = snapshot.bid
+        self._asks[pos] = self._asks[mirror] = snapshot.ask
+        self._writes += 1
+
+    def _span(self) -> slice:
+        if self._writes < self.capacity:
+            return slice(0, self._writes)
+        start = self._writes % self.capacity
+        return slice(start, start + self.capacity)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._span()]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[self._span()]
+
+    @property
+    def bids(self) -> np.ndarray:
+        return self._bids[self._span()]
+
+    @property
+    def asks(self) -> np.ndarray:
+        return self._asks[self._span()]
+
+    def window(self, seconds: float) -> np.ndarray:
+        """Prices from the last `seconds` (relative to the newest snapshot)"""
+        span = self._span()
+        timestamps = self._timestamps[span]
+        if timestamps.size == 0:
+            return timestamps
+        start = np.searchsorted(timestamps, timestamps[-1] - seconds, side='left')
+        return self._prices[span][start:]
+
+    def window_stats(self, seconds: float) -> Optional[Tuple[float, float, float]]:
+        """(high, low, mean) of prices over the last `seconds`, or None if empty"""
+        prices = self.window(seconds)
+        if prices.size == 0:
+            return None
+        return float(prices.max()), float(prices.min()), float(prices.mean())
+
+
 class SchwabClient:
     """
     Schwab API client for options trading
@@ -151,6 +597,52 @@ class SchwabClient:
         self.token_expiry: Optional[datetime] = None
         self.account_hash: Optional[str] = None
 
+        # Endpoint URLs are fixed per session; the account ones are filled in
+        # once _get_account_hash knows which account we trade
+        self._url_quotes = f"{config.api_base}/marketdata/v1/quotes"
+        self._url_chains = f"{config.api_base}/marketdata/v1/chains"
+        self._url_account = ""
+        self._url_orders = ""
+
+        # Authorization lives in session.headers (set on token refresh);
+        # only requests with a body add a content type
+        self._json_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        self._token_headers: Optional[Dict[str, str]] = None
+        self._token_refresher: Optional[asyncio.Task] = None
+
+        # Static part of every option order; place_option_order fills in the rest
+        self._order_template: Dict = {
+            "orderType": "LIMIT",  # Always use LIMIT for options - MARKET orders get terrible fills
+            "session": "NORMAL",
+            "duration": "DAY",
+            "orderStrategyType": "SINGLE"
+        }
+
+        # (symbol, expiration) -> (fetched_at monotonic, chain)
+        self._chain_cache: Dict[Tuple[str, date], Tuple[float, OptionChainArrays]] = {}
+        # symbol -> (fetched_at monotonic, snapshot)
+        self._quote_cache: Dict[str, Tuple[float, PriceSnapshot]] = {}
+        self._fetch_locks: Dict[Tuple, asyncio.Lock] = {}
+
+        # Streamer connection (account activity push instead of order polling)
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._stream_ready = False
+        self._stream_task: Optional[asyncio.Task] = None
+        self._streamer_info: Optional[Dict] = None
+        self._stream_request_id = 0
+        self._order_events: Dict[str, asyncio.Event] = {}
+
+        # Streamed LEVELONE quotes. Updates only carry changed fields, so the
+        # latest values are merged per symbol; subscriptions are replayed on
+        # every (re)connect.
+        self._quote_symbols: set = set()
+        self._quote_fields: Dict[str, Dict] = {}
+        self._streamed_quotes: Dict[str, PriceSnapshot] = {}
+        self._quote_events: Dict[str, asyncio.Event] = {}
+        # occ symbol -> contract the subscription was opened with / latest update
+        self._option_subs: Dict[str, OptionContract] = {}
+        self._streamed_options: Dict[str, OptionContract] = {}
+
     async def initialize(self, client_id: str, client_secret: str, refresh_token: str):
         """
         Initialize the client with OAuth credentials
@@ -163,27 +655,41 @@ class SchwabClient:
         self.client_secret = client_secret
         self.refresh_token = refresh_token
 
-        self.session = aiohttp.ClientSession()
+        auth_string = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._token_headers = {
+            "Authorization": f"Basic {auth_string}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+
+        # Keep warm TLS connections to api.schwabapi.com between ticks
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=120,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=5, connect=1, sock_read=3),
+            headers={"Accept-Encoding": "gzip, deflate"}
+        )
 
-        # Get access token using refresh token
+        # Get access token using refresh token, then keep it fresh in the
+        # background so request methods never wait on a refresh check
         await self._refresh_access_token()
+        self._token_refresher = asyncio.create_task(self._token_refresh_loop())
 
         # Get account hash
         await self._get_account_hash()
 
         logger.info(f"Schwab client initialized. Account: {self.account_hash[:8]}...")
 
+        # Order fills are pushed over the streamer; REST polling is the fallback
+        await self.start_stream()
+
     async def _refresh_access_token(self):
         """Refresh the access token"""
-        auth_string = base64.b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode()
-
-        headers = {
-            "Authorization": f"Basic {auth_string}",
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-
         data = {
             "grant_type": "refresh_token",
             "refresh_token": self.refresh_token
@@ -191,12 +697,13 @@ class SchwabClient:
 
         async with self.session.post(
             self.config.token_url,
-            headers=headers,
+            headers=self._token_headers,
             data=data
         ) as resp:
             if resp.status == 200:
-                token_data = await resp.json()
+                token_data = await _read_json(resp)
                 self.access_token = token_data["access_token"]
+                self.session.headers["Authorization"] = f"Bearer {self.access_token}"
                 new_refresh_token = token_data.get("refresh_token")
 
                 # Persist new refresh token if one was issued
@@ -213,8 +720,25 @@ class SchwabClient:
                 error = await resp.text()
                 raise Exception(f"Token refresh failed: {error}")
 
+    async def _token_refresh_loop(self):
+        """Refresh the access token shortly before it expires"""
+        while True:
+            delay = 0.0
+            if self.token_expiry:
+                delay = (self.token_expiry - datetime.now()).total_seconds() - TOKEN_REFRESH_LEAD
+            await asyncio.sleep(max(delay, 0))
+            try:
+                await self._refresh_access_token()
+            except Exception as e:
+                logger.error(f"Background token refresh failed: {e}")
+                await asyncio.sleep(5)
+
     async def _ensure_valid_token(self):
         """Ensure we have a valid access token"""
+        # The background refresher keeps the token fresh; only refresh
+        # inline if it was never started or has died
+        if self._token_refresher and not self._token_refresher.done():
+            return
         if not self.token_expiry or datetime.now() >= self.token_expiry:
             await self._refresh_access_token()
 
@@ -222,28 +746,310 @@ class SchwabClient:
         """Get the account hash needed for trading"""
         await self._ensure_valid_token()
 
-        headers = {"Authorization": f"Bearer {self.access_token}"}
         url = f"{self.config.api_base}/trader/v1/accounts/accountNumbers"
 
-        async with self.session.get(url, headers=headers) as resp:
+        async with self.session.get(url) as resp:
             if resp.status == 200:
-                accounts = await resp.json()
+                accounts = await _read_json(resp)
                 if accounts:
                     self.account_hash = accounts[0]["hashValue"]
+                    self._url_account = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}"
+                    self._url_orders = f"{self._url_account}/orders"
             else:
                 raise Exception(f"Failed to get accounts: {await resp.text()}")
 
-    async def get_quote(self, symbol: str = "SPY") -> Optional[PriceSnapshot]:
-        """Get real-time quote for underlying"""
-        await self._ensure_valid_token()
+    @property
+    def stream_connected(self) -> bool:
+        return self._stream_ready and self._ws is not None and not self._ws.closed
+
+    async def start_stream(self) -> bool:
+        """
+        Connect to the Schwab streamer and subscribe to account activity
+        plus any LEVELONE quotes requested so far
+        Returns False (and leaves REST polling in charge) on any failure
+        """
+        try:
+            await self._ensure_valid_token()
+
+            url = f"{self.config.api_base}/trader/v1/userPreference"
+
+            async with self.session.get(url) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Streamer unavailable: {await resp.text()}")
+                    return False
+                prefs = await _read_json(resp)
+
+            self._streamer_info = prefs["streamerInfo"][0]
+            self._ws = await self.session.ws_connect(
+                self._streamer_info["streamerSocketUrl"],
+                heartbeat=30
+            )
+
+            await self._stream_send("ADMIN", "LOGIN", {
+                "Authorization": self.access_token,
+                "SchwabClientChannel": self._streamer_info["schwabClientChannel"],
+                "SchwabClientFunctionId": self._streamer_info["schwabClientFunctionId"]
+            })
+            login = _json_loads((await self._ws.receive(timeout=5)).data)
+            content = login["response"][0]["content"]
+            if content.get("code") != 0:
+                raise Exception(f"Streamer login failed: {content.get('msg')}")
+
+            await self._stream_send("ACCT_ACTIVITY", "SUBS", {
+                "keys": "Account Activity",
+                "fields": "0,1,2,3"
+            })
+            if self._quote_symbols:
+                await self._stream_send("LEVELONE_EQUITIES", "SUBS", {
+                    "keys": ",".join(self._quote_symbols),
+                    "fields": LEVELONE_EQUITY_FIELDS
+                })
+            if self._option_subs:
+                await self._stream_send("LEVELONE_OPTIONS", "SUBS", {
+                    "keys": ",".join(self._option_subs),
+                    "fields": "0," + ",".join(LEVELONE_OPTION_FIELDS)
+                })
+
+            self._stream_ready = True
+            self._stream_task = asyncio.create_task(self._stream_reader())
+            logger.info("Streamer connected (account activity, quotes)")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Streamer connection failed, polling order status instead: {e}")
+            if self._ws is not None:
+                await self._ws.close()
+                self._ws = None
+            return False
+
+    async def _stream_send(self, service: str, command: str, parameters: Dict):
+        """Send a single request to the streamer"""
+        self._stream_request_id += 1
+        request = {
+            "requests": [{
+                "service": service,
+                "command": command,
+                "requestid": str(self._stream_request_id),
+                "SchwabClientCustomerId": self._streamer_info["schwabClientCustomerId"],
+                "SchwabClientCorrelId": self._streamer_info["schwabClientCorrelId"],
+                "parameters": parameters
+            }]
+        }
+        await self._ws.send_bytes(_json_dumps(request))
+
+    async def _stream_reader(self):
+        """Dispatch streamer data messages until the socket closes"""
+        try:
+            async for msg in self._ws:
+                if msg.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    break
+
+                payload = _json_loads(msg.data)
+                for data in payload.get("data", ()):
+                    service = data.get("service")
+                    if service == "LEVELONE_EQUITIES":
+                        self._on_equity_quotes(data.get("content", ()))
+                    elif service == "LEVELONE_OPTIONS":
+                        self._on_option_quotes(data.get("content", ()))
+                    elif service == "ACCT_ACTIVITY":
+                        self._on_account_activity(data.get("content", ()))
+        except asyncio.CancelledError:
+            self._stream_ready = False
+            self._ws = None
+            raise
+        except Exception as e:
+            logger.error(f"Streamer error: {type(e).__name__}: {e}")
+
+        logger.warning("Streamer disconnected, falling back to REST polling")
+        self._stream_ready = False
+        self._ws = None
+        # Streamed quotes go stale from here; the reconnect re-subscribes and
+        # Schwab resends full records
+        self._quote_fields.clear()
+        self._streamed_quotes.clear()
+        self._streamed_options.clear()
+        # Wake any waiters so they re-check over REST
+        for event in self._order_events.values():
+            event.set()
+        for event in self._quote_events.values():
+            event.set()
+
+        self._stream_task = asyncio.create_task(self._reconnect_stream())
+
+    async def _reconnect_stream(self):
+        """Re-open the streamer with capped exponential backoff"""
+        delay = 1.0
+        while True:
+            await asyncio.sleep(delay)
+            if await self.start_stream():
+                return
+            delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+
+    def _on_account_activity(self, content):
+        """Signal waiters for any order mentioned in an account activity message"""
+        for item in content:
+            message = item.get("3")
+            if not message:
+                continue
+            if isinstance(message, str):
+                try:
+                    message = _json_loads(message)
+                except ValueError:
+                    continue
+
+            order_id = _find_order_id(message)
+            if order_id:
+                self._order_events.setdefault(order_id, asyncio.Event()).set()
+
+    async def wait_for_order_event(self, order_id: str, timeout: float) -> bool:
+        """
+        Wait until the streamer reports activity on an order
+        Returns False on timeout
+        """
+        event = self._order_events.setdefault(order_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            event.clear()
+
+    def forget_order(self, order_id: str):
+        """Drop streamer bookkeeping for an order that is no longer tracked"""
+        self._order_events.pop(order_id, None)
+
+    def _on_equity_quotes(self, content):
+        """Merge LEVELONE_EQUITIES updates and wake quote waiters"""
+        now = time.time()
+        for item in content:
+            symbol = item.get("key")
+            fields = self._quote_fields.setdefault(symbol, {})
+            fields.update(item)
+            if "3" not in fields:
+                continue  # No last price yet
+            self._streamed_quotes[symbol] = PriceSnapshot(
+                timestamp=now,
+                price=fields["3"],
+                bid=fields.get("1", 0),
+                ask=fields.get("2", 0),
+                volume=fields.get("8", 0)
+            )
+            event = self._quote_events.get(symbol)
+            if event is not None:
+                event.set()
+
+    def _on_option_quotes(self, content):
+        """Apply LEVELONE_OPTIONS updates to the subscribed contracts"""
+        for item in content:
+            symbol = item.get("key")
+            base = self._streamed_options.get(symbol) or self._option_subs.get(symbol)
+            if base is None:
+                continue
+            updates = {attr: item[key] for key, attr in LEVELONE_OPTION_FIELDS.items() if key in item}
+            if updates:
+                self._streamed_options[symbol] = replace(base, **updates)
+
+    def quote_streaming(self, symbol: str) -> bool:
+        """True while LEVELONE_EQUITIES updates for `symbol` are being pushed"""
+        return self.stream_connected and symbol in self._quote_symbols
+
+    async def subscribe_quotes(self, symbols: List[str]):
+        """Stream quotes for `symbols` (read them with next_quote)"""
+        new = [s for s in symbols if s not in self._quote_symbols]
+        if not new:
+            return
+        self._quote_symbols.update(new)
+        if self.stream_connected:
+            await self._stream_send("LEVELONE_EQUITIES", "ADD", {
+                "keys": ",".join(new),
+                "fields": LEVELONE_EQUITY_FIELDS
+            })
+
+    async def wait_for_quote(self, symbol: str, timeout: float) -> Optional[PriceSnapshot]:
+        """
+        Wait for the next streamed quote on a subscribed symbol
+        Returns None on timeout or if the streamer drops
+        """
+        event = self._quote_events.setdefault(symbol, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        event.clear()
+        return self._streamed_quotes.get(symbol)
 
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/marketdata/v1/quotes"
+    async def next_quote(self, symbol: str = "SPY") -> Optional[PriceSnapshot]:
+        """
+        Quote for the next trading-loop tick: the next streamed update when
+        the symbol is subscribed and the streamer is up, otherwise REST
+        """
+        if self.quote_streaming(symbol):
+            snapshot = await self.wait_for_quote(symbol, QUOTE_STREAM_TIMEOUT)
+            if snapshot is not None:
+                return snapshot
+        return await self.get_quote(symbol)
+
+    async def subscribe_option_quotes(self, contract: OptionContract):
+        """Stream bid/ask/Greeks for an open position's contract"""
+        if contract.symbol in self._option_subs:
+            return
+        self._option_subs[contract.symbol] = contract
+        if self.stream_connected:
+            await self._stream_send("LEVELONE_OPTIONS", "ADD", {
+                "keys": contract.symbol,
+                "fields": "0," + ",".join(LEVELONE_OPTION_FIELDS)
+            })
+
+    async def unsubscribe_option_quotes(self, occ_symbol: str):
+        """Stop streaming a contract once its position is closed"""
+        if self._option_subs.pop(occ_symbol, None) is None:
+            return
+        self._streamed_options.pop(occ_symbol, None)
+        if self.stream_connected:
+            await self._stream_send("LEVELONE_OPTIONS", "UNSUBS", {"keys": occ_symbol})
+
+    def streamed_option(self, occ_symbol: str) -> Optional[OptionContract]:
+        """Latest streamed quote for a subscribed contract (None unless the streamer is up)"""
+        if not self.stream_connected:
+            return None
+        return self._streamed_options.get(occ_symbol)
+
+    def _fetch_lock(self, key: Tuple) -> asyncio.Lock:
+        """Per-key lock so concurrent callers share one in-flight request"""
+        lock = self._fetch_locks.get(key)
+        if lock is None:
+            lock = self._fetch_locks[key] = asyncio.Lock()
+        return lock
+
+    async def get_quote(self, symbol: str = "SPY") -> Optional[PriceSnapshot]:
+        """
+        Get real-time quote for underlying
+        Cached for config.quote_cache_ms; concurrent callers share one request
+        """
+        ttl = self.config.quote_cache_ms / 1000.0
+        cached = self._quote_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        async with self._fetch_lock(("quote", symbol)):
+            # Another caller may have refreshed it while we waited
+            cached = self._quote_cache.get(symbol)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            snapshot = await self._fetch_quote(symbol)
+            if snapshot:
+                self._quote_cache[symbol] = (time.monotonic(), snapshot)
+            return snapshot
+
+    async def _fetch_quote(self, symbol: str) -> Optional[PriceSnapshot]:
+        url = self._url_quotes
         params = {"symbols": symbol}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 if symbol in data:
                     quote = data[symbol]["quote"]
                     return PriceSnapshot(
@@ -256,18 +1062,51 @@ class SchwabClient:
         return None
 
     async def get_option_chain(self, symbol: str = "SPY",
-                                expiration: Optional[date] = None) -> List[OptionContract]:
+                                expiration: Optional[date] = None,
+                                force: bool = False) -> List[OptionContract]:
         """
         Get option chain for 0DTE
         Returns calls and puts for today's expiration
         """
-        await self._ensure_valid_token()
+        chain = await self.get_option_chain_arrays(symbol, expiration, force=force)
+        return chain.contracts
 
+    async def get_option_chain_arrays(self, symbol: str = "SPY",
+                                      expiration: Optional[date] = None,
+                                      force: bool = False) -> OptionChainArrays:
+        """
+        Get option chain for 0DTE as parallel NumPy arrays
+
+        Results are cached for config.chain_cache_ms so signal handling,
+        position management and paper trading share one fetch, and
+        concurrent callers wait on a single in-flight request.
+        force=True skips the cache (but still joins an in-flight fetch).
+        """
         if expiration is None:
             expiration = date.today()
 
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/marketdata/v1/chains"
+        ttl = 0.0 if force else self.config.chain_cache_ms / 1000.0
+        cache_key = (symbol, expiration)
+        cached = self._chain_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        requested_at = time.monotonic()
+        async with self._fetch_lock(("chain",) + cache_key):
+            # Another caller may have refreshed it while we waited; with
+            # force, only a fetch that completed after this call counts
+            cached = self._chain_cache.get(cache_key)
+            if cached and (cached[0] >= requested_at if force else time.monotonic() - cached[0] < ttl):
+                return cached[1]
+
+            chain = await self._fetch_option_chain(symbol, expiration)
+            if chain is None:
+                return OptionChainArrays.from_chain_json({}, symbol)
+            self._chain_cache[cache_key] = (time.monotonic(), chain)
+            return chain
+
+    async def _fetch_option_chain(self, symbol: str, expiration: date) -> Optional[OptionChainArrays]:
+        url = self._url_chains
 
         params = {
             "symbol": symbol,
@@ -278,91 +1117,79 @@ class SchwabClient:
             "toDate": expiration.isoformat()
         }
 
-        contracts = []
-
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
+                return OptionChainArrays.from_chain_json(data, symbol)
+        return None
 
-                # Parse calls
-                if "callExpDateMap" in data:
-                    for exp_date, strikes in data["callExpDateMap"].items():
-                        for strike, options in strikes.items():
-                            for opt in options:
-                                contracts.append(self._parse_option(opt, OptionType.CALL))
+    async def get_option_quote(self, occ_symbol: str) -> Optional[OptionContract]:
+        """
+        Get a single option contract by OCC symbol
+        Much smaller than a chain pull when only one contract is needed
+        """
+        url = self._url_quotes
+        params = {"symbols": occ_symbol}
 
-                # Parse puts
-                if "putExpDateMap" in data:
-                    for exp_date, strikes in data["putExpDateMap"].items():
-                        for strike, options in strikes.items():
-                            for opt in options:
-                                contracts.append(self._parse_option(opt, OptionType.PUT))
+        async with self.session.get(url, params=params) as resp:
+            if resp.status == 200:
+                data = await _read_json(resp)
+                if occ_symbol in data:
+                    return self._parse_option_quote(occ_symbol, data[occ_symbol])
+        return None
 
-        return contracts
+    def _parse_option_quote(self, occ_symbol: str, quote_data: Dict) -> OptionContract:
+        """Parse a single-option entry from the quotes endpoint"""
+        quote = quote_data.get("quote", {})
+        reference = quote_data.get("reference", {})
+        option_type = OptionType.PUT if reference.get("contractType") == "P" else OptionType.CALL
 
-    def _parse_option(self, opt_data: Dict, option_type: OptionType) -> OptionContract:
-        """Parse option data from API response"""
         return OptionContract(
-            symbol=opt_data.get("symbol", ""),
-            underlying=self.config.symbol,
+            symbol=occ_symbol,
+            underlying=reference.get("underlying", self.config.symbol),
             option_type=option_type,
-            strike=float(opt_data.get("strikePrice", 0)),
+            strike=float(reference.get("strikePrice", 0)),
             expiration=date.today(),  # 0DTE
-            bid=float(opt_data.get("bid", 0)),
-            ask=float(opt_data.get("ask", 0)),
-            last=float(opt_data.get("last", 0)),
-            delta=float(opt_data.get("delta", 0)),
-            gamma=float(opt_data.get("gamma", 0)),
-            theta=float(opt_data.get("theta", 0)),
-            vega=float(opt_data.get("vega", 0)),
-            volume=int(opt_data.get("totalVolume", 0)),
-            open_interest=int(opt_data.get("openInterest", 0))
+            bid=float(quote.get("bidPrice", 0)),
+            ask=float(quote.get("askPrice", 0)),
+            last=float(quote.get("lastPrice", 0)),
+            delta=float(quote.get("delta", 0)),
+            gamma=float(quote.get("gamma", 0)),
+            theta=float(quote.get("theta", 0)),
+            vega=float(quote.get("vega", 0)),
+            volume=int(quote.get("totalVolume", 0)),
+            open_interest=int(quote.get("openInterest", 0))
         )
 
+    def _parse_option(self, opt_data: Dict, option_type: OptionType) -> OptionContract:
+        """Parse option data from API response"""
+        return _parse_option_json(opt_data, option_type, self.config.symbol)
+
     async def place_option_order(self, contract: OptionContract,
                                   side: OrderSide, quantity: int = 1,
                                   limit_price: Optional[float] = None) -> Dict:
         """Place an option order"""
-        await self._ensure_valid_token()
-
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json"
-        }
-
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}/orders"
+        url = self._url_orders
 
-        # Always use LIMIT for options - MARKET orders get terrible fills
-        order_type = "LIMIT"
         if limit_price is None:
             limit_price = contract.mid_price
 
-        order_data = {
-            "orderType": order_type,
-            "session": "NORMAL",
-            "duration": "DAY",
-            "orderStrategyType": "SINGLE",
-            "orderLegCollection": [
-                {
-                    "instruction": side.value,
-                    "quantity": quantity,
-                    "instrument": {
-                        "symbol": contract.symbol,
-                        "assetType": "OPTION"
-                    }
-                }
-            ],
-            "price": str(round(limit_price, 2))
-        }
+        order_data = self._order_template.copy()
+        order_data["orderLegCollection"] = [{
+            "instruction": side.value,
+            "quantity": quantity,
+            "instrument": {"symbol": contract.symbol, "assetType": "OPTION"}
+        }]
+        order_data["price"] = _format_cents(_to_cents(limit_price))
 
         start_time = time.perf_counter()
 
-        async with self.session.post(url, headers=headers, json=order_data) as resp:
+        async with self.session.post(url, headers=self._json_headers, data=_json_dumps(order_data)) as resp:
             latency = (time.perf_counter() - start_time) * 1000
 
             if resp.status in [200, 201]:
                 location = resp.headers.get("Location", "")
-                order_id = location.split("/")[-1] if location else ""
+                order_id = location.rpartition("/")[2]
                 logger.info(f"Order placed in {latency:.2f}ms: {side.value} {quantity}x {contract.symbol} @ ${limit_price:.2f}")
                 return {"orderId": order_id, "status": "PLACED", "limit_price": limit_price}
             else:
@@ -372,12 +1199,9 @@ class SchwabClient:
 
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an open order"""
-        await self._ensure_valid_token()
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}/orders/{order_id}"
+        url = f"{self._url_orders}/{order_id}"
 
-        async with self.session.delete(url, headers=headers) as resp:
+        async with self.session.delete(url) as resp:
             if resp.status in [200, 204]:
                 logger.info(f"Order {order_id} cancelled")
                 return True
@@ -385,27 +1209,25 @@ class SchwabClient:
 
     async def get_order_status(self, order_id: str) -> Optional[Dict]:
         """Get detailed order status"""
-        await self._ensure_valid_token()
+        url = f"{self._url_orders}/{order_id}"
 
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}/orders/{order_id}"
-
-        async with self.session.get(url, headers=headers) as resp:
+        async with self.session.get(url) as resp:
             if resp.status == 200:
-                return await resp.json()
+                return await _read_json(resp)
         return None
 
+    async def get_order_statuses(self, order_ids: List[str]) -> List[Optional[Dict]]:
+        """Get status for several orders concurrently (one entry per id, in order)"""
+        return list(await asyncio.gather(*(self.get_order_status(i) for i in order_ids)))
+
     async def get_positions(self) -> List[Dict]:
         """Get current option positions"""
-        await self._ensure_valid_token()
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}"
+        url = self._url_account
         params = {"fields": "positions"}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 positions = data.get("securitiesAccount", {}).get("positions", [])
                 # Filter for options only
                 return [p for p in positions if p.get("instrument", {}).get("assetType") == "OPTION"]
@@ -413,15 +1235,12 @@ class SchwabClient:
 
     async def get_account_info(self) -> Dict:
         """Get account balances and buying power for safety checks"""
-        await self._ensure_valid_token()
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/trader/v1/accounts/{self.account_hash}"
+        url = self._url_account
         params = {"fields": "positions"}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
                 account = data.get("securitiesAccount", {})
                 balances = account.get("currentBalances", {})
 
@@ -441,6 +1260,12 @@ class SchwabClient:
 
     async def close(self):
         """Clean up"""
+        if self._token_refresher:
+            self._token_refresher.cancel()
+        if self._stream_task:
+            self._stream_task.cancel()
+        if self._ws is not None:
+            await self._ws.close()
         if self.session:
             await self.session.close()
 
@@ -455,12 +1280,27 @@ class ZeroDTEMomentumStrategy:
         self.client = client
         self.config = config
         self.safety_manager = safety_manager  # Optional account safety manager
-        self.price_history = deque(maxlen=1000)
+        self.price_history = PriceHistory()
+        self._abs_target_delta = abs(config.target_delta)
+        # Exit thresholds are fixed for the session; resolve them once
+        self._trail_mult = 1.0 - config.trailing_stop_percent / 100.0
+        self._sl_threshold = -config.stop_loss_percent
+        self._tp_threshold = config.take_profit_percent
         self.last_signal_time = 0
         self.last_signal_price = 0
         self.current_position: Optional[Dict] = None
         self.position_entry_price = 0
         self.running = False
+        self._manage_task: Optional[asyncio.Task] = None
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
+
+        # End-of-day exit cutoff, recomputed when the date rolls over
+        self._eod_exit_epoch = 0.0
+        self._eod_rollover_epoch = 0.0
+
+        # _is_trading_hours result, recomputed at most once per second
+        self._hours_checked_at = 0.0
+        self._hours_ok = False
 
         # Trailing stop tracking
         self.high_water_mark: float = 0.0
@@ -470,23 +1310,51 @@ class ZeroDTEMomentumStrategy:
     def stop(self):
         """Stop the trading loop"""
         self.running = False
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+
+    def _emit_heartbeat(self):
+        """Log a status line and re-arm the timer (runs off the tick loop)"""
+        if not self.running:
+            return
+        self._heartbeat_handle = asyncio.get_running_loop().call_later(
+            HEARTBEAT_INTERVAL, self._emit_heartbeat)
+
+        if len(self.price_history) and self._is_trading_hours():
+            status = "Monitoring" if not self.current_position else "In position"
+            logger.info("[Heartbeat] %s | SPY: $%.2f | Reference: $%.2f | "
+                        "Signals today: checking for $%s moves",
+                        status, self.price_history.prices[-1], self.last_signal_price,
+                        self.config.min_price_movement)
+
+    def record_price(self, snapshot: PriceSnapshot):
+        """Append a snapshot to the price history"""
+        self.price_history.push(snapshot)
 
     def _is_trading_hours(self) -> bool:
         """Check if within allowed trading hours"""
-        now = datetime.now()
-        current_time = now.strftime("%H:%M")
+        now = time.time()
+        if now - self._hours_checked_at < 1.0:
+            return self._hours_ok
 
-        # Check if it's a weekday
-        if now.weekday() >= 5:
-            return False
+        local = time.localtime(now)
+        minute = local.tm_hour * 60 + local.tm_min
 
-        # Check time bounds
-        if current_time < self.config.no_trade_before:
-            return False
-        if current_time > self.config.no_trade_after:
-            return False
+        # Weekday and within time bounds
+        self._hours_ok = (
+            local.tm_wday < 5
+            and self.config.no_trade_before_minute <= minute <= self.config.no_trade_after_minute
+        )
+        self._hours_checked_at = now
+        return self._hours_ok
 
-        return True
+    def eod_exit_due(self) -> bool:
+        """True once today's end-of-day exit time has passed"""
+        now = time.time()
+        if now >= self._eod_rollover_epoch:
+            self._eod_exit_epoch, self._eod_rollover_epoch = _eod_exit_times(now)
+        return now >= self._eod_exit_epoch
 
     def detect_momentum_signal(self, current: PriceSnapshot) -> Optional[OptionType]:
         """
@@ -498,41 +1366,44 @@ class ZeroDTEMomentumStrategy:
 
         current_time = current.timestamp
         current_price = current.price
+        last_price = self.last_signal_price
 
         # Initialize reference point
-        if self.last_signal_price == 0:
+        if last_price == 0:
             self.last_signal_price = current_price
             self.last_signal_time = current_time
             return None
 
         # Calculate movement
+        time_window = self.config.time_window
+        min_move = self.config.min_price_movement
         time_diff = current_time - self.last_signal_time
-        price_diff = current_price - self.last_signal_price
+        price_diff = current_price - last_price
 
-        # Check for signal within time window
-        if time_diff <= self.config.time_window:
+        if time_diff <= time_window and logger.isEnabledFor(logging.DEBUG):
             # Log when we're getting close to a signal (80%+ of threshold)
-            threshold_pct = abs(price_diff) / self.config.min_price_movement
-            if threshold_pct >= 0.80 and threshold_pct < 1.0:
+            threshold_pct = abs(price_diff) / min_move
+            if 0.80 <= threshold_pct < 1.0:
                 direction = "up" if price_diff > 0 else "down"
                 logger.debug(f"Near signal: SPY {direction} ${abs(price_diff):.2f} in {time_diff:.1f}s "
-                            f"({threshold_pct*100:.0f}% of ${self.config.min_price_movement} threshold)")
+                            f"({threshold_pct*100:.0f}% of ${min_move} threshold)")
 
-            if abs(price_diff) >= self.config.min_price_movement:
-                if self.current_position is None:
-                    # Update reference
-                    self.last_signal_price = current_price
-                    self.last_signal_time = current_time
+        # Check for signal within time window
+        move = _momentum_direction(time_diff, price_diff, time_window, min_move)
+        if move and self.current_position is None:
+            # Update reference
+            self.last_signal_price = current_price
+            self.last_signal_time = current_time
 
-                    if price_diff > 0:
-                        logger.info(f"BULLISH Signal: SPY +${price_diff:.2f} in {time_diff:.1f}s")
-                        return OptionType.CALL
-                    else:
-                        logger.info(f"BEARISH Signal: SPY ${price_diff:.2f} in {time_diff:.1f}s")
-                        return OptionType.PUT
+            if move > 0:
+                logger.info(f"BULLISH Signal: SPY +${price_diff:.2f} in {time_diff:.1f}s")
+                return OptionType.CALL
+            else:
+                logger.info(f"BEARISH Signal: SPY ${price_diff:.2f} in {time_diff:.1f}s")
+                return OptionType.PUT
 
         # Reset reference if window expired
-        if time_diff >= self.config.time_window:
+        if time_diff >= time_window:
             self.last_signal_price = current_price
             self.last_signal_time = current_time
 
@@ -544,60 +1415,35 @@ class ZeroDTEMomentumStrategy:
         Select the best contract based on delta, spread, and liquidity
         Enhanced with slippage-aware filtering
         """
-        chain = await self.client.get_option_chain()
+        chain = await self.client.get_option_chain_arrays()
 
         # Filter by type
-        candidates = [c for c in chain if c.option_type == option_type]
-
-        # Target delta (puts have negative delta)
-        target_delta = self.config.target_delta
-        if option_type == OptionType.PUT:
-            target_delta = -target_delta
-
-        # Score contracts with enhanced slippage-aware filtering
-        scored = []
-        rejection_reasons = {"no_quote": 0, "low_premium": 0, "wide_spread": 0, "low_volume": 0, "low_oi": 0}
-
-        for c in candidates:
-            # Basic validity
-            if c.bid <= 0 or c.ask <= 0:
-                rejection_reasons["no_quote"] += 1
-                continue
-
-            # SLIPPAGE FILTER 1: Minimum premium (spread is less % impact)
-            if c.mid_price < self.config.min_option_price:
-                rejection_reasons["low_premium"] += 1
-                continue
-
-            # SLIPPAGE FILTER 2: Tight spread requirement
-            if c.spread_percent > self.config.max_bid_ask_spread:
-                rejection_reasons["wide_spread"] += 1
-                continue
-
-            # SLIPPAGE FILTER 3: Minimum volume for liquidity
-            if c.volume < self.config.min_volume:
-                rejection_reasons["low_volume"] += 1
-                continue
-
-            # SLIPPAGE FILTER 4: Minimum open interest
-            if c.open_interest < self.config.min_open_interest:
-                rejection_reasons["low_oi"] += 1
-                continue
-
-            # Calculate scores (lower is better)
-            delta_score = abs(abs(c.delta) - abs(target_delta))
-            spread_score = c.spread_percent * 2  # Weight spread heavily
-
-            # Bonus for higher volume (better fills)
-            volume_bonus = -min(c.volume / 10000, 0.1)  # Up to -0.1 bonus
-
-            # Combined score
-            score = delta_score + spread_score + volume_bonus
-            scored.append((score, c))
-
-        if not scored:
+        is_type = chain.is_call if option_type == OptionType.CALL else ~chain.is_call
+        idx = np.flatnonzero(is_type)
+
+        # Target-delta contracts sit near the money; skip the far wings
+        idx = nearest_strikes(chain, idx, spy_price, self.config.candidate_strikes)
+
+        # Fill in Black-Scholes deltas where the chain has none (missing, NaN
+        # or Schwab's -999 placeholder)
+        delta = chain.delta[idx]
+        missing = np.flatnonzero(~(np.abs(delta) <= 1.0))
+        if missing.size:
+            delta = delta.copy()
+            spot = round(spy_price, 2)
+            seconds_left = _seconds_to_close()
+            is_call = option_type == OptionType.CALL
+            strike = chain.strike[idx]
+            volatility = chain.volatility[idx]
+            for j in missing:
+                delta[j] = _bs_delta(spot, float(strike[j]), seconds_left,
+                                     float(volatility[j]) / 100.0, self.config.risk_free_rate, is_call)
+
+        row, rejection_reasons = rank_contracts(chain, idx, delta, self._abs_target_delta, self.config)
+
+        if row is None:
             logger.warning(f"No suitable {option_type.value} contracts found "
-                          f"(checked {len(candidates)} candidates)")
+                          f"(checked {idx.size} candidates)")
             logger.warning(f"Rejection breakdown: no_quote={rejection_reasons['no_quote']}, "
                           f"low_premium(<${self.config.min_option_price})={rejection_reasons['low_premium']}, "
                           f"wide_spread(>{self.config.max_bid_ask_spread*100:.0f}%)={rejection_reasons['wide_spread']}, "
@@ -606,8 +1452,7 @@ class ZeroDTEMomentumStrategy:
             return None
 
         # Return best contract
-        scored.sort(key=lambda x: x[0])
-        best = scored[0][1]
+        best = chain.contract(row)
 
         # Calculate expected slippage cost
         expected_slippage = best.spread / 2  # Half spread on entry + exit
@@ -621,8 +1466,17 @@ class ZeroDTEMomentumStrategy:
 
     async def execute_signal(self, signal: OptionType, spy_price: float):
         """Execute the trading signal with slippage-aware order management"""
-        # Select contract
-        contract = await self.select_contract(signal, spy_price)
+        # Select contract and fetch balances for the safety check concurrently
+        if self.safety_manager:
+            contract, account_data = await asyncio.gather(
+                self.select_contract(signal, spy_price),
+                self.client.get_account_info(),
+                return_exceptions=True
+            )
+            if isinstance(contract, BaseException):
+                raise contract
+        else:
+            contract = await self.select_contract(signal, spy_price)
 
         if not contract:
             return
@@ -630,7 +1484,8 @@ class ZeroDTEMomentumStrategy:
         # SAFETY CHECK: Verify we can afford this trade
         if self.safety_manager:
             try:
-                account_data = await self.client.get_account_info()
+                if isinstance(account_data, BaseException):
+                    raise account_data
 
                 # Import here to avoid circular dependency
                 from schwab_account_safety import AccountInfo
@@ -682,14 +1537,18 @@ class ZeroDTEMomentumStrategy:
             self.position_entry_price = actual_fill
             logger.info(f"Position opened: {signal.value} @ ${actual_fill:.2f} "
                        f"(limit was ${limit_price:.2f})")
+            await self.client.subscribe_option_quotes(contract)
 
     async def _place_order_with_fill_check(self, contract: OptionContract,
                                            initial_limit: float,
                                            side: OrderSide) -> Optional[Dict]:
         """Place order and chase price if not filled"""
-        limit_price = initial_limit
+        # Chase in whole cents so repeated increments stay exact
+        limit_cents = _to_cents(initial_limit)
+        chase_cents = _to_cents(self.config.chase_increment_cents)
 
         for attempt in range(self.config.max_chase_attempts):
+            limit_price = limit_cents / 100
             result = await self.client.place_option_order(
                 contract=contract,
                 side=side,
@@ -704,15 +1563,23 @@ class ZeroDTEMomentumStrategy:
             if not order_id:
                 return None
 
-            # Wait for fill with timeout
-            start_time = time.time()
-            while time.time() - start_time < self.config.order_timeout_seconds:
+            # Wait for fill with timeout. With the streamer up we only hit
+            # REST when it reports activity on this order (or once at timeout,
+            # in case an event was missed).
+            deadline = time.monotonic() + self.config.order_timeout_seconds
+            poll_count = 0
+            while (remaining := deadline - time.monotonic()) > 0:
+                streaming = self.client.stream_connected
+                if streaming:
+                    await self.client.wait_for_order_event(order_id, remaining)
+
                 order_status = await self.client.get_order_status(order_id)
 
                 if order_status:
                     status = order_status.get("status")
 
                     if status == "FILLED":
+                        self.client.forget_order(order_id)
                         fill_price = float(order_status.get("price", limit_price))
                         logger.info(f"Order filled on attempt {attempt + 1} @ ${fill_price:.2f}")
                         return {"orderId": order_id, "filled": True, "fill_price": fill_price}
@@ -721,28 +1588,35 @@ class ZeroDTEMomentumStrategy:
                         logger.warning(f"Order {status}")
                         break
 
-                await asyncio.sleep(0.1)  # Check every 100ms
+                if not streaming:
+                    await asyncio.sleep(min(order_poll_delay(poll_count), remaining))
+                    poll_count += 1
+
+            self.client.forget_order(order_id)
 
             # Not filled - cancel and chase
-            await self.client.cancel_order(order_id)
+            if attempt >= self.config.max_chase_attempts - 1:
+                await self.client.cancel_order(order_id)
+            else:
+                # Refresh contract data for current bid/ask while the cancel is in flight
+                _, updated = await asyncio.gather(
+                    self.client.cancel_order(order_id),
+                    self.client.get_option_quote(contract.symbol)
+                )
 
-            if attempt < self.config.max_chase_attempts - 1:
                 # Chase price more aggressively
                 if side == OrderSide.BUY_TO_OPEN:
-                    limit_price += self.config.chase_increment_cents
+                    limit_cents += chase_cents
                 else:
-                    limit_price -= self.config.chase_increment_cents
+                    limit_cents -= chase_cents
 
-                logger.info(f"Chasing: attempt {attempt + 2}, new limit ${limit_price:.2f}")
+                logger.info(f"Chasing: attempt {attempt + 2}, new limit ${limit_cents / 100:.2f}")
 
-                # Refresh contract data for current bid/ask
-                chain = await self.client.get_option_chain()
-                updated = next((c for c in chain if c.symbol == contract.symbol), None)
                 if updated:
                     contract = updated
                     # Don't chase beyond the ask (for buys)
-                    if side == OrderSide.BUY_TO_OPEN and limit_price < contract.ask:
-                        limit_price = contract.ask + self.config.limit_offset_cents
+                    if side == OrderSide.BUY_TO_OPEN and limit_cents < _to_cents(contract.ask):
+                        limit_cents = _to_cents(contract.ask + self.config.limit_offset_cents)
 
         logger.warning(f"Order not filled after {self.config.max_chase_attempts} attempts")
         return None
@@ -752,36 +1626,25 @@ class ZeroDTEMomentumStrategy:
         Update trailing stop based on current option price.
         Returns (should_exit, trailing_stop_price)
         """
-        # Calculate current P&L percentage
-        pnl_percent = ((current_price - entry_price) / entry_price) * 100
-
-        # Check if trailing stop should activate
-        if not self.trailing_stop_active:
-            if pnl_percent >= self.config.trailing_stop_activation:
-                self.trailing_stop_active = True
-                self.high_water_mark = current_price
-                # Set initial trailing stop
-                self.trailing_stop_price = current_price * (1 - self.config.trailing_stop_percent / 100)
-                logger.info(f"Trailing stop activated at {pnl_percent:.1f}% profit, "
-                           f"stop set at ${self.trailing_stop_price:.2f}")
+        was_active = self.trailing_stop_active
+        (should_exit, self.high_water_mark, self.trailing_stop_price,
+         self.trailing_stop_active, raised) = _trailing_stop_step(
+            current_price, entry_price, self.high_water_mark, self.trailing_stop_price,
+            was_active, self.config.trailing_stop_activation, self._trail_mult)
+
+        if not was_active:
+            if self.trailing_stop_active:
+                pnl_percent = ((current_price - entry_price) / entry_price) * 100
+                logger.info("Trailing stop activated at %.1f%% profit, stop set at $%.2f",
+                            pnl_percent, self.trailing_stop_price)
             return False, 0.0
 
-        # Update high water mark if price moved higher
-        if current_price > self.high_water_mark:
-            self.high_water_mark = current_price
-            new_stop = current_price * (1 - self.config.trailing_stop_percent / 100)
-
-            # Only ratchet stop upward
-            if new_stop > self.trailing_stop_price:
-                self.trailing_stop_price = new_stop
-                logger.info(f"Trailing stop raised to ${self.trailing_stop_price:.2f} "
-                           f"(high: ${self.high_water_mark:.2f})")
+        if raised:
+            # Deferred formatting: this can fire on every tick of a rally
+            logger.info("Trailing stop raised to $%.2f (high: $%.2f)",
+                        self.trailing_stop_price, self.high_water_mark)
 
-        # Check if stop was hit
-        if current_price <= self.trailing_stop_price:
-            return True, self.trailing_stop_price
-
-        return False, self.trailing_stop_price
+        return should_exit, self.trailing_stop_price
 
     async def manage_position(self, spy_price: float):
         """Manage open position - check for exit conditions"""
@@ -791,12 +1654,11 @@ class ZeroDTEMomentumStrategy:
         contract = self.current_position["contract"]
         entry_price = self.current_position["entry_price"]
 
-        # Get current option price
-        chain = await self.client.get_option_chain()
-        current_contract = next(
-            (c for c in chain if c.symbol == contract.symbol),
-            None
-        )
+        # Get current option price: streamed if available, otherwise a
+        # single-contract REST quote (not the whole chain)
+        current_contract = self.client.streamed_option(contract.symbol)
+        if current_contract is None:
+            current_contract = await self.client.get_option_quote(contract.symbol)
 
         if not current_contract:
             logger.warning("Could not find current contract price")
@@ -805,35 +1667,26 @@ class ZeroDTEMomentumStrategy:
         current_price = current_contract.mid_price
         pnl_percent = ((current_price - entry_price) / entry_price) * 100
 
-        # Check exit conditions
-        should_exit = False
-        exit_reason = ""
-
-        # Check trailing stop first (if enabled)
+        # Check exit conditions. The trailing stop updates its high-water mark
+        # on every tick, so it always runs; the reason string is only built
+        # once an exit is chosen (the end-of-day exit takes precedence)
+        trail_exit = False
+        trail_price = 0.0
         if self.config.use_trailing_stop:
-            should_trail_exit, trail_price = self.manage_trailing_stop(current_price, entry_price)
-            if should_trail_exit:
-                should_exit = True
-                exit_reason = f"Trailing stop hit at ${trail_price:.2f} ({pnl_percent:.1f}%)"
-
-        # Stop loss (fixed)
-        if not should_exit and pnl_percent <= -self.config.stop_loss_percent:
-            should_exit = True
-            exit_reason = f"Stop loss hit ({pnl_percent:.1f}%)"
+            trail_exit, trail_price = self.manage_trailing_stop(current_price, entry_price)
 
-        # Take profit (fixed)
-        if not should_exit and pnl_percent >= self.config.take_profit_percent:
-            should_exit = True
-            exit_reason = f"Take profit hit ({pnl_percent:.1f}%)"
-
-        # Time-based exit (close before 3:55 PM)
-        current_time = datetime.now().strftime("%H:%M")
-        if current_time >= "15:55":
-            should_exit = True
+        if self.eod_exit_due():
             exit_reason = "End of day exit"
+        elif trail_exit:
+            exit_reason = f"Trailing stop hit at ${trail_price:.2f} ({pnl_percent:.1f}%)"
+        elif pnl_percent <= self._sl_threshold:
+            exit_reason = f"Stop loss hit ({pnl_percent:.1f}%)"
+        elif pnl_percent >= self._tp_threshold:
+            exit_reason = f"Take profit hit ({pnl_percent:.1f}%)"
+        else:
+            return
 
-        if should_exit:
-            await self._close_position(current_contract, exit_reason)
+        await self._close_position(current_contract, exit_reason)
 
     async def _close_position(self, contract: OptionContract, reason: str):
         """Close the current position with slippage-aware exit"""
@@ -855,8 +1708,8 @@ class ZeroDTEMomentumStrategy:
             pnl = (exit_price - entry) * 100  # Per contract ($100 multiplier)
             pnl_percent = ((exit_price - entry) / entry) * 100
 
-            logger.info(f"Position closed: {reason} | Entry: ${entry:.2f} | "
-                       f"Exit: ${exit_price:.2f} | P&L: ${pnl:.2f} ({pnl_percent:.1f}%)")
+            logger.info("Position closed: %s | Entry: $%.2f | Exit: $%.2f | P&L: $%.2f (%.1f%%)",
+                        reason, entry, exit_price, pnl, pnl_percent)
 
             # Record trade with safety manager
             if self.safety_manager:
@@ -871,6 +1724,7 @@ class ZeroDTEMomentumStrategy:
                            f"{status['day_trades_last_5_days']} day trades (last 5 days)")
 
             self.current_position = None
+            await self.client.unsubscribe_option_quotes(contract.symbol)
             # Reset trailing stop state
             self.trailing_stop_active = False
             self.high_water_mark = 0.0
@@ -885,6 +1739,7 @@ class ZeroDTEMomentumStrategy:
                 limit_price=contract.bid - 0.05  # Very aggressive
             )
             self.current_position = None
+            await self.client.unsubscribe_option_quotes(contract.symbol)
             # Reset trailing stop state
             self.trailing_stop_active = False
             self.high_water_mark = 0.0
@@ -904,43 +1759,76 @@ class ZeroDTEMomentumStrategy:
                        f"trails {self.config.trailing_stop_percent}% below high")
 
         self.running = True
-        last_heartbeat = 0
-        heartbeat_interval = 300  # Log status every 5 minutes
+        next_tick = time.monotonic()
+
+        # Periodic heartbeat to show bot is alive, driven by the loop's timer
+        self._heartbeat_handle = asyncio.get_running_loop().call_later(
+            HEARTBEAT_INTERVAL, self._emit_heartbeat)
+
+        # Loop-invariant lookups, bound once
+        symbol = self.config.symbol
+        quote_streaming = self.client.quote_streaming
+        next_quote = self.client.next_quote
+        record_price = self.record_price
+        detect_momentum_signal = self.detect_momentum_signal
+        poll_interval_active = self.config.poll_interval_active
+        poll_interval_idle = self.config.poll_interval_idle
+
+        # Push SPY quotes over the streamer; REST polling covers any outage
+        await self.client.subscribe_quotes([symbol])
 
         while self.running:
             try:
-                # Get SPY quote
-                snapshot = await self.client.get_quote("SPY")
-
-                # Periodic heartbeat to show bot is alive
-                now = time.time()
-                if now - last_heartbeat >= heartbeat_interval:
-                    if snapshot and self._is_trading_hours():
-                        status = "Monitoring" if not self.current_position else "In position"
-                        logger.info(f"[Heartbeat] {status} | SPY: ${snapshot.price:.2f} | "
-                                   f"Reference: ${self.last_signal_price:.2f} | "
-                                   f"Signals today: checking for ${self.config.min_price_movement} moves")
-                    last_heartbeat = now
+                # Get SPY quote (waits on the stream, or polls)
+                streaming = quote_streaming(symbol)
+                snapshot = await next_quote(symbol)
 
                 if snapshot:
-                    self.price_history.append(snapshot)
+                    record_price(snapshot)
+
+                    managing = self._manage_task is not None and not self._manage_task.done()
 
                     # Check for entry signals (only if no position)
-                    if not self.current_position:
-                        signal = self.detect_momentum_signal(snapshot)
+                    if not self.current_position and not managing:
+                        signal = detect_momentum_signal(snapshot)
                         if signal:
                             await self.execute_signal(signal, snapshot.price)
 
-                    # Manage existing position
-                    if self.current_position:
-                        await self.manage_position(snapshot.price)
+                    # Manage existing position alongside the next quote fetch
+                    if self.current_position and not managing:
+                        self._manage_task = asyncio.create_task(self.manage_position(snapshot.price))
+                        self._manage_task.add_done_callback(self._on_manage_done)
 
-                # Polling interval (50ms for options)
-                await asyncio.sleep(0.05)
+                # Polling interval, held to a fixed cadence (streamed quotes
+                # pace themselves)
+                if not streaming:
+                    interval = poll_interval_active if self.current_position else poll_interval_idle
+                    next_tick = await sleep_until_next_tick(next_tick, interval)
+                else:
+                    # A quote that landed mid-tick is returned without
+                    # suspending; yield so the manage task runs first
+                    await asyncio.sleep(0)
 
             except Exception as e:
                 logger.error(f"Error in trading loop: {type(e).__name__}: {e}", exc_info=True)
                 await asyncio.sleep(1)
+                next_tick = time.monotonic()
+
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+
+        # Let an in-flight manage_position finish (errors are logged by the callback)
+        if self._manage_task is not None and not self._manage_task.done():
+            await asyncio.wait([self._manage_task])
+
+    def _on_manage_done(self, task: asyncio.Task):
+        """Surface errors from a background manage_position run"""
+        if task.cancelled():
+            return
+        e = task.exception()
+        if e is not None:
+            logger.error(f"Error managing position: {type(e).__name__}: {e}", exc_info=e)
 
 
 async def main():
@@ -949,9 +1837,9 @@ async def main():
     For full functionality, use schwab_0dte_main.py instead.
     """
     # Import config manager
-    from schwab_config_manager import SchwabConfigManager
+    from schwab_config_manager import get_config_manager
 
-    config_mgr = SchwabConfigManager()
+    config_mgr = get_config_manager()
 
     # Load credentials
     credentials = config_mgr.load_credentials()
@@ -988,6 +1876,7 @@ async def main():
         )
 
         strategy = ZeroDTEMomentumStrategy(client, config)
+        install_eager_task_factory()
         await strategy.run()
 
     except KeyboardInterrupt:
@@ -1002,9 +1891,11 @@ if __name__ == "__main__":
     print("  Run --setup first:           python schwab_0dte_main.py --setup")
     print("="*60 + "\n")
 
+    # Use uvloop if available
     try:
         import uvloop
         asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop for enhanced performance")
     except ImportError:
         pass
 
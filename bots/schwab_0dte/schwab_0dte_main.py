@@ -14,16 +14,14 @@ import argparse
 import logging
 import signal
 import sys
-from datetime import datetime, time as dt_time
-from typing import Optional
-
-# Import bot components
-from schwab_0dte_bot import (
-    SchwabClient,
-    ZeroDTEMomentumStrategy,
-    OptionsConfig,
-    OptionType
-)
+import time
+from datetime import datetime, timedelta, time as dt_time
+from typing import Optional, TYPE_CHECKING
+
+# The trading engine (aiohttp, NumPy, numba) is imported where it is first
+# needed, so --setup and --show start without loading it
+if TYPE_CHECKING:
+    from schwab_0dte_bot import SchwabClient, ZeroDTEMomentumStrategy
 from schwab_config_manager import (
     SchwabConfigManager,
     SchwabCredentials,
@@ -54,10 +52,11 @@ class TradingApplication:
         self.paper_trading = paper_trading
         self.live_flag_explicit = live_flag_explicit  # True if --live was passed
         self.enable_safety = enable_safety
-        self.client: Optional[SchwabClient] = None
-        self.strategy: Optional[ZeroDTEMomentumStrategy] = None
+        self.client: Optional["SchwabClient"] = None
+        self.strategy: Optional["ZeroDTEMomentumStrategy"] = None
         self.safety_manager = None
         self.running = False
+        self.run_task: Optional[asyncio.Task] = None  # Task running run()
 
         # Set log level
         logging.getLogger().setLevel(getattr(logging, log_level.upper()))
@@ -82,6 +81,8 @@ class TradingApplication:
         if not self.live_flag_explicit and 'paper_trading' in environment:
             self.paper_trading = environment['paper_trading']
 
+        from schwab_0dte_bot import OptionsConfig, SchwabClient, ZeroDTEMomentumStrategy
+
         # Build options config
         options_config = OptionsConfig(
             time_window=params.time_window_seconds,
@@ -198,35 +199,13 @@ class TradingApplication:
     def _time_until_market_open(self) -> Optional[float]:
         """Calculate seconds until market opens"""
         now = datetime.now()
-
-        # If weekend, calculate time until Monday 9:30
-        days_until_monday = (7 - now.weekday()) % 7
-        if days_until_monday == 0 and now.time() > dt_time(16, 0):
-            days_until_monday = 7 - now.weekday() if now.weekday() < 5 else (7 - now.weekday() + 1)
-
-        if now.weekday() >= 5:
-            days_until_monday = 7 - now.weekday()
-            if now.weekday() == 6:
-                days_until_monday = 1
-
-        # Calculate next market open
+        weekday = now.weekday()
         next_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
 
-        if now.time() >= dt_time(16, 0) or now.weekday() >= 5:
-            # After close or weekend - next trading day
-            if now.weekday() == 4:  # Friday after close
-                days_until_monday = 3
-            elif now.weekday() == 5:  # Saturday
-                days_until_monday = 2
-            elif now.weekday() == 6:  # Sunday
-                days_until_monday = 1
-            else:
-                days_until_monday = 1
-
-            from datetime import timedelta
-            next_open = (now + timedelta(days=days_until_monday)).replace(
-                hour=9, minute=30, second=0, microsecond=0
-            )
+        # After the close or on a weekend: the next weekday's open
+        # (Mon-Thu -> tomorrow, Fri -> +3, Sat -> +2, Sun -> +1)
+        if weekday >= 5 or now.time() >= dt_time(16, 0):
+            next_open += timedelta(days=1 if weekday < 4 else 7 - weekday)
 
         return (next_open - now).total_seconds()
 
@@ -266,45 +245,59 @@ class TradingApplication:
 
     async def _run_paper_trading(self):
         """Paper trading mode - simulates trades without placing real orders"""
+        from schwab_0dte_bot import sleep_until_next_tick
+
         logger.info("Paper trading session started")
 
         paper_position = None
         paper_pnl = 0.0
         paper_trades = []
+        next_tick = time.monotonic()
+
+        # Loop-invariant lookups, bound once
+        client = self.client
+        strategy = self.strategy
+        symbol = strategy.config.symbol
+        sl_threshold = strategy._sl_threshold
+        tp_threshold = strategy._tp_threshold
+        poll_interval_active = strategy.config.poll_interval_active
+        poll_interval_idle = strategy.config.poll_interval_idle
+        await client.subscribe_quotes([symbol])
 
         while self.running and self._is_market_open():
             try:
-                # Get SPY quote
-                snapshot = await self.client.get_quote("SPY")
+                # Get SPY quote (waits on the stream, or polls)
+                streaming = client.quote_streaming(symbol)
+                snapshot = await client.next_quote(symbol)
 
                 if snapshot:
-                    self.strategy.price_history.append(snapshot)
+                    strategy.record_price(snapshot)
 
                     # Check for signals
                     if not paper_position:
-                        signal = self.strategy.detect_momentum_signal(snapshot)
+                        signal = strategy.detect_momentum_signal(snapshot)
 
                         if signal:
                             # Simulate entry
-                            contract = await self.strategy.select_contract(signal, snapshot.price)
+                            contract = await strategy.select_contract(signal, snapshot.price)
 
                             if contract:
                                 paper_position = {
                                     "contract": contract,
                                     "entry_price": contract.mid_price,
-                                    "entry_time": datetime.now(),
+                                    "entry_time": time.time(),
                                     "signal": signal
                                 }
                                 logger.info(f"[PAPER] Opened: {signal.value} {contract.symbol} @ ${contract.mid_price:.2f}")
+                                await client.subscribe_option_quotes(contract)
 
                     # Manage paper position
                     if paper_position:
-                        # Get current price
-                        chain = await self.client.get_option_chain()
-                        current = next(
-                            (c for c in chain if c.symbol == paper_position["contract"].symbol),
-                            None
-                        )
+                        # Get current price (streamed, else a single-contract quote)
+                        occ_symbol = paper_position["contract"].symbol
+                        current = client.streamed_option(occ_symbol)
+                        if current is None:
+                            current = await client.get_option_quote(occ_symbol)
 
                         if current:
                             entry = paper_position["entry_price"]
@@ -315,13 +308,13 @@ class TradingApplication:
                             should_exit = False
                             reason = ""
 
-                            if pnl_pct <= -self.strategy.config.stop_loss_percent:
+                            if pnl_pct <= sl_threshold:
                                 should_exit = True
                                 reason = "Stop loss"
-                            elif pnl_pct >= self.strategy.config.take_profit_percent:
+                            elif pnl_pct >= tp_threshold:
                                 should_exit = True
                                 reason = "Take profit"
-                            elif datetime.now().strftime("%H:%M") >= "15:55":
+                            elif strategy.eod_exit_due():
                                 should_exit = True
                                 reason = "EOD exit"
 
@@ -339,13 +332,19 @@ class TradingApplication:
 
                                 logger.info(f"[PAPER] Closed: {reason} | P&L: ${pnl:.2f} ({pnl_pct:.1f}%)")
                                 logger.info(f"[PAPER] Session P&L: ${paper_pnl:.2f} | Trades: {len(paper_trades)}")
+                                await client.unsubscribe_option_quotes(paper_position["contract"].symbol)
                                 paper_position = None
 
-                await asyncio.sleep(0.05)
+                if not streaming:
+                    interval = poll_interval_active if paper_position else poll_interval_idle
+                    next_tick = await sleep_until_next_tick(next_tick, interval)
+                else:
+                    await asyncio.sleep(0)
 
             except Exception as e:
                 logger.error(f"Paper trading error: {type(e).__name__}: {e}", exc_info=True)
                 await asyncio.sleep(1)
+                next_tick = time.monotonic()
 
         # Session summary
         if paper_trades:
@@ -371,8 +370,14 @@ class TradingApplication:
         if self.strategy:
             self.strategy.stop()
 
-        # Small delay to let the loop exit cleanly
-        await asyncio.sleep(0.2)
+        # Wait for the trading loop to exit (it finishes its current tick),
+        # cancelling it if it is stuck or sleeping until the open
+        task = self.run_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            done, _ = await asyncio.wait([task], timeout=2.0)
+            if not done:
+                task.cancel()
+                await asyncio.wait([task])
 
         # Then close the client session
         if self.client:
@@ -391,12 +396,15 @@ def setup_signal_handlers(app: TradingApplication, loop: asyncio.AbstractEventLo
         try:
             loop.add_signal_handler(sig, signal_handler)
         except NotImplementedError:
-            # Windows doesn't support add_signal_handler
-            signal.signal(sig, lambda s, f: signal_handler())
+            # Windows doesn't support add_signal_handler; the classic handler
+            # can fire mid-callback, so schedule the shutdown on the loop
+            signal.signal(sig, lambda s, f: loop.call_soon_threadsafe(signal_handler))
 
 
 async def main_async(args):
     """Async main entry point"""
+    from schwab_0dte_bot import install_eager_task_factory
+
     app = TradingApplication(
         config_dir=args.config_dir,
         paper_trading=not args.live,
@@ -408,6 +416,7 @@ async def main_async(args):
     # Setup signal handlers
     loop = asyncio.get_event_loop()
     setup_signal_handlers(app, loop)
+    install_eager_task_factory()
 
     # Initialize
     if not await app.initialize():
@@ -415,8 +424,11 @@ async def main_async(args):
         return 1
 
     # Run
+    app.run_task = asyncio.create_task(app.run())
     try:
-        await app.run()
+        await app.run_task
+    except asyncio.CancelledError:
+        pass
     except KeyboardInterrupt:
         pass
     finally:
@@ -509,6 +521,16 @@ Risk Warning:
         show_current_config()
         return 0
 
+    # Use uvloop if available; live trading refuses to start without it
+    # (except on Windows, where uvloop does not exist)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+        if args.live and sys.platform != "win32":
+            print("\n  uvloop is required for live trading: pip install uvloop")
+            return 1
+
     # Live trading confirmation
     if args.live:
         print("\n" + "="*60)
@@ -532,15 +554,10 @@ Risk Warning:
 
         print("\n  Starting live trading...")
 
-    # Use uvloop if available
-    try:
-        import uvloop
-        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    # Run the bot (uvloop.run builds its loop directly, no policy swap)
+    if uvloop is not None:
         logger.info("Using uvloop for enhanced performance")
-    except ImportError:
-        pass
-
-    # Run the bot
+        return uvloop.run(main_async(args))
     return asyncio.run(main_async(args))
 
 
@@ -12,6 +12,7 @@ except ImportError:
     import sys
     subprocess.check_call([sys.executable, "-m", "pip", "install", "requests"])
     import requests
+from requests.adapters import HTTPAdapter
 
 print("""
 ╔════════════════════════════════════════╗
@@ -28,6 +29,10 @@ PORT = 8081
 
 TOKEN_RESULT = None
 
+# One pooled session so the keep-alive connection and TLS session are reused
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 class InstantHandler(BaseHTTPRequestHandler):
     def do_GET(self):
         global TOKEN_RESULT
@@ -44,7 +49,7 @@ class InstantHandler(BaseHTTPRequestHandler):
                 auth = base64.b64encode(f"{CLIENT_ID}:{CLIENT_SECRET}".encode()).decode()
                 
                 try:
-                    response = requests.post(
+                    response = SESSION.post(
                         "https://api.schwabapi.com/v1/oauth/token",
                         headers={
                             "Authorization": f"Basic {auth}",
@@ -16,10 +16,10 @@ import json
 import time
 import logging
 import base64
+import numpy as np
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from collections import deque
 from enum import Enum
 
 # Reuse core components from schwab_0dte_bot
@@ -28,8 +28,18 @@ from schwab_0dte_bot import (
     OrderSide,
     OptionContract,
     PriceSnapshot,
+    PriceHistory,
     SchwabClient,
-    OptionsConfig
+    OptionsConfig,
+    HEARTBEAT_INTERVAL,
+    _eod_exit_times,
+    _hm_to_minute,
+    _read_json,
+    _to_cents,
+    _trailing_stop_step,
+    nearest_strikes,
+    order_poll_delay,
+    rank_contracts
 )
 
 logging.basicConfig(
@@ -61,6 +71,12 @@ class VolatileStockConfig:
     min_volume: int = 200  # Lower volume requirement
     min_open_interest: int = 300  # Lower OI requirement
 
+    # Contract scoring weights (see rank_contracts)
+    spread_weight: float = 2.0
+    volume_bonus_scale: float = 5000
+    max_volume_bonus: float = 0.15  # Bigger volume bonus for stocks
+    candidate_strikes: int = 20  # Only score the strikes closest to spot
+
     # Risk management - wider for volatility
     max_positions: int = 1
     stop_loss_percent: float = 40.0  # Wider stop for volatility
@@ -85,6 +101,10 @@ class VolatileStockConfig:
     # Scanning
     scan_interval_seconds: int = 30  # Re-scan tickers every 30s
 
+    # Quote polling cadence (seconds): fast in a position, slower while scanning
+    poll_interval_active: float = 0.05
+    poll_interval_idle: float = 0.25
+
     # Schwab API
     api_base: str = "https://api.schwabapi.com"
 
@@ -93,6 +113,10 @@ class VolatileStockConfig:
             # Default: Highly liquid volatile stocks
             self.tickers = ["NVDA", "TSLA", "AMD", "AAPL", "MSFT", "META", "GOOGL", "AMZN"]
 
+        # Trading window as minutes since midnight for integer comparisons
+        self.no_trade_before_minute = _hm_to_minute(self.no_trade_before)
+        self.no_trade_after_minute = _hm_to_minute(self.no_trade_after)
+
 
 @dataclass
 class TickerSnapshot:
@@ -129,17 +153,16 @@ class VolatileStockClient(SchwabClient):
         """Get quotes for multiple symbols"""
         await self._ensure_valid_token()
 
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/marketdata/v1/quotes"
+        url = self._url_quotes
 
         # Schwab allows comma-separated symbols
         params = {"symbols": ",".join(symbols)}
 
         snapshots = {}
 
-        async with self.session.get(url, headers=headers, params=params) as resp:
+        async with self.session.get(url, params=params) as resp:
             if resp.status == 200:
-                data = await resp.json()
+                data = await _read_json(resp)
 
                 for symbol in symbols:
                     if symbol in data:
@@ -162,63 +185,8 @@ class VolatileStockClient(SchwabClient):
     async def get_option_chain_for_symbol(self, symbol: str,
                                           expiration: Optional[date] = None) -> List[OptionContract]:
         """Get option chain for a specific symbol (not just SPY)"""
-        await self._ensure_valid_token()
-
-        if expiration is None:
-            expiration = date.today()
-
-        headers = {"Authorization": f"Bearer {self.access_token}"}
-        url = f"{self.config.api_base}/marketdata/v1/chains"
-
-        params = {
-            "symbol": symbol,
-            "contractType": "ALL",
-            "includeUnderlyingQuote": "true",
-            "strategy": "SINGLE",
-            "fromDate": expiration.isoformat(),
-            "toDate": expiration.isoformat()
-        }
-
-        contracts = []
-
-        async with self.session.get(url, headers=headers, params=params) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-
-                # Parse calls
-                if "callExpDateMap" in data:
-                    for exp_date, strikes in data["callExpDateMap"].items():
-                        for strike, options in strikes.items():
-                            for opt in options:
-                                contracts.append(self._parse_option_for_symbol(opt, OptionType.CALL, symbol))
-
-                # Parse puts
-                if "putExpDateMap" in data:
-                    for exp_date, strikes in data["putExpDateMap"].items():
-                        for strike, options in strikes.items():
-                            for opt in options:
-                                contracts.append(self._parse_option_for_symbol(opt, OptionType.PUT, symbol))
-
-        return contracts
-
-    def _parse_option_for_symbol(self, opt_data: Dict, option_type: OptionType, symbol: str) -> OptionContract:
-        """Parse option data for any symbol"""
-        return OptionContract(
-            symbol=opt_data.get("symbol", ""),
-            underlying=symbol,
-            option_type=option_type,
-            strike=float(opt_data.get("strikePrice", 0)),
-            expiration=date.today(),  # 0DTE
-            bid=float(opt_data.get("bid", 0)),
-            ask=float(opt_data.get("ask", 0)),
-            last=float(opt_data.get("last", 0)),
-            delta=float(opt_data.get("delta", 0)),
-            gamma=float(opt_data.get("gamma", 0)),
-            theta=float(opt_data.get("theta", 0)),
-            vega=float(opt_data.get("vega", 0)),
-            volume=int(opt_data.get("totalVolume", 0)),
-            open_interest=int(opt_data.get("openInterest", 0))
-        )
+        chain = await self.get_option_chain_arrays(symbol, expiration)
+        return chain.contracts
 
 
 class VolatileStockMomentumStrategy:
@@ -231,10 +199,15 @@ class VolatileStockMomentumStrategy:
         self.client = client
         self.config = config
         self.safety_manager = safety_manager  # Optional account safety manager
+        self._abs_target_delta = abs(config.target_delta)
+        # Exit thresholds are fixed for the session; resolve them once
+        self._trail_mult = 1.0 - config.trailing_stop_percent / 100.0
+        self._sl_threshold = -config.stop_loss_percent
+        self._tp_threshold = config.take_profit_percent
 
         # Price history per ticker
-        self.price_history: Dict[str, deque] = {
-            ticker: deque(maxlen=1000) for ticker in config.tickers
+        self.price_history: Dict[str, PriceHistory] = {
+            ticker: PriceHistory() for ticker in config.tickers
         }
 
         # Signal tracking per ticker
@@ -245,6 +218,7 @@ class VolatileStockMomentumStrategy:
         self.current_position: Optional[Dict] = None
         self.current_ticker: Optional[str] = None
         self.running = False
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
 
         # Trailing stop tracking
         self.high_water_mark: float = 0.0
@@ -252,28 +226,59 @@ class VolatileStockMomentumStrategy:
         self.trailing_stop_active: bool = False
 
         # Ticker scoring
-        self.last_scan_time: float = 0
+        self.last_scan_time: float = float("-inf")  # time.monotonic()
         self.active_ticker: Optional[str] = None
         self.ticker_scores: Dict[str, float] = {}
 
+        # End-of-day exit cutoff, recomputed when the date rolls over
+        self._eod_exit_epoch = 0.0
+        self._eod_rollover_epoch = 0.0
+
+        # _is_trading_hours result, recomputed at most once per second
+        self._hours_checked_at = 0.0
+        self._hours_ok = False
+
     def stop(self):
         """Stop the trading loop"""
         self.running = False
+        if self._heartbeat_handle is not None:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+
+    def _emit_heartbeat(self):
+        """Log a status line and re-arm the timer"""
+        if not self.running:
+            return
+        self._heartbeat_handle = asyncio.get_running_loop().call_later(
+            HEARTBEAT_INTERVAL, self._emit_heartbeat)
+
+        if self._is_trading_hours():
+            status = "Scanning tickers" if not self.current_position else f"In position ({self.current_ticker})"
+            logger.info("[Heartbeat] %s | Active: %s", status, self.active_ticker or 'None')
+
+    def eod_exit_due(self) -> bool:
+        """True once today's end-of-day exit time has passed"""
+        now = time.time()
+        if now >= self._eod_rollover_epoch:
+            self._eod_exit_epoch, self._eod_rollover_epoch = _eod_exit_times(now)
+        return now >= self._eod_exit_epoch
 
     def _is_trading_hours(self) -> bool:
         """Check if within allowed trading hours"""
-        now = datetime.now()
-        current_time = now.strftime("%H:%M")
+        now = time.time()
+        if now - self._hours_checked_at < 1.0:
+            return self._hours_ok
 
-        if now.weekday() >= 5:
-            return False
+        local = time.localtime(now)
+        minute = local.tm_hour * 60 + local.tm_min
 
-        if current_time < self.config.no_trade_before:
-            return False
-        if current_time > self.config.no_trade_after:
-            return False
-
-        return True
+        # Weekday and within time bounds
+        self._hours_ok = (
+            local.tm_wday < 5
+            and self.config.no_trade_before_minute <= minute <= self.config.no_trade_after_minute
+        )
+        self._hours_checked_at = now
+        return self._hours_ok
 
     async def scan_best_ticker(self, snapshots: Dict[str, TickerSnapshot]) -> Optional[str]:
         """
@@ -338,28 +343,33 @@ class VolatileStockMomentumStrategy:
 
         current_time = current.timestamp
         current_price = current.price
+        last_price = self.last_signal_price.get(ticker, 0)
 
         # Initialize reference point
-        if self.last_signal_price.get(ticker, 0) == 0:
+        if last_price == 0:
             self.last_signal_price[ticker] = current_price
             self.last_signal_time[ticker] = current_time
             return None
 
         # Calculate movement
+        time_window = self.config.time_window
+        min_move = self.config.min_percent_movement
         time_diff = current_time - self.last_signal_time[ticker]
-        price_diff = current_price - self.last_signal_price[ticker]
-        percent_move = (price_diff / self.last_signal_price[ticker]) * 100
+        price_diff = current_price - last_price
+        percent_move = (price_diff / last_price) * 100
+        abs_move = -percent_move if percent_move < 0 else percent_move
 
         # Check for signal within time window
-        if time_diff <= self.config.time_window:
+        if time_diff <= time_window:
             # Log when approaching threshold
-            threshold_pct = abs(percent_move) / self.config.min_percent_movement
-            if threshold_pct >= 0.80 and threshold_pct < 1.0:
-                direction = "up" if percent_move > 0 else "down"
-                logger.debug(f"Near signal [{ticker}]: {direction} {abs(percent_move):.2f}% in {time_diff:.1f}s "
-                           f"({threshold_pct*100:.0f}% of {self.config.min_percent_movement}% threshold)")
-
-            if abs(percent_move) >= self.config.min_percent_movement:
+            if logger.isEnabledFor(logging.DEBUG):
+                threshold_pct = abs_move / min_move
+                if 0.80 <= threshold_pct < 1.0:
+                    direction = "up" if percent_move > 0 else "down"
+                    logger.debug(f"Near signal [{ticker}]: {direction} {abs_move:.2f}% in {time_diff:.1f}s "
+                               f"({threshold_pct*100:.0f}% of {min_move}% threshold)")
+
+            if abs_move >= min_move:
                 if self.current_position is None:
                     # Update reference
                     self.last_signal_price[ticker] = current_price
@@ -373,7 +383,7 @@ class VolatileStockMomentumStrategy:
                         return OptionType.PUT
 
         # Reset reference if window expired
-        if time_diff >= self.config.time_window:
+        if time_diff >= time_window:
             self.last_signal_price[ticker] = current_price
             self.last_signal_time[ticker] = current_time
 
@@ -382,52 +392,22 @@ class VolatileStockMomentumStrategy:
     async def select_contract(self, ticker: str, option_type: OptionType,
                              stock_price: float) -> Optional[OptionContract]:
         """Select best contract for the given ticker"""
-        chain = await self.client.get_option_chain_for_symbol(ticker)
+        chain = await self.client.get_option_chain_arrays(ticker)
 
         # Filter by type
-        candidates = [c for c in chain if c.option_type == option_type]
+        is_type = chain.is_call if option_type == OptionType.CALL else ~chain.is_call
+        idx = np.flatnonzero(is_type)
 
-        # Target delta
-        target_delta = self.config.target_delta
-        if option_type == OptionType.PUT:
-            target_delta = -target_delta
+        # Target-delta contracts sit near the money; skip the far wings
+        idx = nearest_strikes(chain, idx, stock_price, self.config.candidate_strikes)
 
-        # Score contracts
-        scored = []
-        rejection_reasons = {"no_quote": 0, "low_premium": 0, "wide_spread": 0, "low_volume": 0, "low_oi": 0}
+        # Score contracts (a missing delta counts as 0)
+        delta = np.nan_to_num(chain.delta[idx], nan=0.0)
+        row, rejection_reasons = rank_contracts(chain, idx, delta, self._abs_target_delta, self.config)
 
-        for c in candidates:
-            if c.bid <= 0 or c.ask <= 0:
-                rejection_reasons["no_quote"] += 1
-                continue
-
-            if c.mid_price < self.config.min_option_price:
-                rejection_reasons["low_premium"] += 1
-                continue
-
-            if c.spread_percent > self.config.max_bid_ask_spread:
-                rejection_reasons["wide_spread"] += 1
-                continue
-
-            if c.volume < self.config.min_volume:
-                rejection_reasons["low_volume"] += 1
-                continue
-
-            if c.open_interest < self.config.min_open_interest:
-                rejection_reasons["low_oi"] += 1
-                continue
-
-            # Scoring
-            delta_score = abs(abs(c.delta) - abs(target_delta))
-            spread_score = c.spread_percent * 2
-            volume_bonus = -min(c.volume / 5000, 0.15)
-
-            score = delta_score + spread_score + volume_bonus
-            scored.append((score, c))
-
-        if not scored:
+        if row is None:
             logger.warning(f"No suitable {option_type.value} contracts for {ticker} "
-                          f"(checked {len(candidates)} candidates)")
+                          f"(checked {idx.size} candidates)")
             logger.warning(f"Rejections: no_quote={rejection_reasons['no_quote']}, "
                           f"low_premium(<${self.config.min_option_price})={rejection_reasons['low_premium']}, "
                           f"wide_spread(>{self.config.max_bid_ask_spread*100:.0f}%)={rejection_reasons['wide_spread']}, "
@@ -436,8 +416,7 @@ class VolatileStockMomentumStrategy:
             return None
 
         # Best contract
-        scored.sort(key=lambda x: x[0])
-        best = scored[0][1]
+        best = chain.contract(row)
 
         expected_slippage = best.spread / 2
         slippage_pct = (expected_slippage * 2 / best.mid_price) * 100
@@ -450,7 +429,17 @@ class VolatileStockMomentumStrategy:
 
     async def execute_signal(self, ticker: str, signal: OptionType, stock_price: float):
         """Execute trading signal for the given ticker"""
-        contract = await self.select_contract(ticker, signal, stock_price)
+        # Select contract and fetch balances for the safety check concurrently
+        if self.safety_manager:
+            contract, account_data = await asyncio.gather(
+                self.select_contract(ticker, signal, stock_price),
+                self.client.get_account_info(),
+                return_exceptions=True
+            )
+            if isinstance(contract, BaseException):
+                raise contract
+        else:
+            contract = await self.select_contract(ticker, signal, stock_price)
 
         if not contract:
             return
@@ -458,7 +447,8 @@ class VolatileStockMomentumStrategy:
         # SAFETY CHECK: Verify we can afford this trade
         if self.safety_manager:
             try:
-                account_data = await self.client.get_account_info()
+                if isinstance(account_data, BaseException):
+                    raise account_data
 
                 # Import here to avoid circular dependency
                 from schwab_account_safety import AccountInfo
@@ -514,9 +504,12 @@ class VolatileStockMomentumStrategy:
                                            initial_limit: float,
                                            side: OrderSide) -> Optional[Dict]:
         """Place order and chase price if not filled"""
-        limit_price = initial_limit
+        # Chase in whole cents so repeated increments stay exact
+        limit_cents = _to_cents(initial_limit)
+        chase_cents = _to_cents(self.config.chase_increment_cents)
 
         for attempt in range(self.config.max_chase_attempts):
+            limit_price = limit_cents / 100
             result = await self.client.place_option_order(
                 contract=contract,
                 side=side,
@@ -532,8 +525,9 @@ class VolatileStockMomentumStrategy:
                 return None
 
             # Wait for fill
-            start_time = time.time()
-            while time.time() - start_time < self.config.order_timeout_seconds:
+            deadline = time.monotonic() + self.config.order_timeout_seconds
+            poll_count = 0
+            while (remaining := deadline - time.monotonic()) > 0:
                 order_status = await self.client.get_order_status(order_id)
 
                 if order_status:
@@ -548,22 +542,22 @@ class VolatileStockMomentumStrategy:
                         logger.warning(f"Order {status}")
                         break
 
-                await asyncio.sleep(0.1)
+                await asyncio.sleep(min(order_poll_delay(poll_count), remaining))
+                poll_count += 1
 
             # Chase price
             await self.client.cancel_order(order_id)
 
             if attempt < self.config.max_chase_attempts - 1:
                 if side == OrderSide.BUY_TO_OPEN:
-                    limit_price += self.config.chase_increment_cents
+                    limit_cents += chase_cents
                 else:
-                    limit_price -= self.config.chase_increment_cents
+                    limit_cents -= chase_cents
 
-                logger.info(f"Chasing: attempt {attempt + 2}, new limit ${limit_price:.2f}")
+                logger.info(f"Chasing: attempt {attempt + 2}, new limit ${limit_cents / 100:.2f}")
 
-                # Refresh contract
-                chain = await self.client.get_option_chain_for_symbol(contract.underlying)
-                updated = next((c for c in chain if c.symbol == contract.symbol), None)
+                # Refresh contract (single quote, not the whole chain)
+                updated = await self.client.get_option_quote(contract.symbol)
                 if updated:
                     contract = updated
 
@@ -571,31 +565,24 @@ class VolatileStockMomentumStrategy:
 
     def manage_trailing_stop(self, current_price: float, entry_price: float) -> Tuple[bool, float]:
         """Manage trailing stop"""
-        pnl_percent = ((current_price - entry_price) / entry_price) * 100
-
-        if not self.trailing_stop_active:
-            if pnl_percent >= self.config.trailing_stop_activation:
-                self.trailing_stop_active = True
-                self.high_water_mark = current_price
-                self.trailing_stop_price = current_price * (1 - self.config.trailing_stop_percent / 100)
-                logger.info(f"Trailing stop activated at {pnl_percent:.1f}% profit, "
-                           f"stop set at ${self.trailing_stop_price:.2f}")
+        was_active = self.trailing_stop_active
+        (should_exit, self.high_water_mark, self.trailing_stop_price,
+         self.trailing_stop_active, raised) = _trailing_stop_step(
+            current_price, entry_price, self.high_water_mark, self.trailing_stop_price,
+            was_active, self.config.trailing_stop_activation, self._trail_mult)
+
+        if not was_active:
+            if self.trailing_stop_active:
+                pnl_percent = ((current_price - entry_price) / entry_price) * 100
+                logger.info("Trailing stop activated at %.1f%% profit, stop set at $%.2f",
+                            pnl_percent, self.trailing_stop_price)
             return False, 0.0
 
-        # Update high water mark
-        if current_price > self.high_water_mark:
-            self.high_water_mark = current_price
-            new_stop = current_price * (1 - self.config.trailing_stop_percent / 100)
-
-            if new_stop > self.trailing_stop_price:
-                self.trailing_stop_price = new_stop
-                logger.info(f"Trailing stop raised to ${self.trailing_stop_price:.2f}")
+        if raised:
+            # Deferred formatting: this can fire on every tick of a rally
+            logger.info("Trailing stop raised to $%.2f", self.trailing_stop_price)
 
-        # Check if hit
-        if current_price <= self.trailing_stop_price:
-            return True, self.trailing_stop_price
-
-        return False, self.trailing_stop_price
+        return should_exit, self.trailing_stop_price
 
     async def manage_position(self):
         """Manage open position"""
@@ -607,11 +594,8 @@ class VolatileStockMomentumStrategy:
         entry_price = self.current_position["entry_price"]
 
         # Get current option price
-        chain = await self.client.get_option_chain_for_symbol(ticker)
-        current_contract = next(
-            (c for c in chain if c.symbol == contract.symbol),
-            None
-        )
+        chain = await self.client.get_option_chain_arrays(ticker)
+        current_contract = chain.find(contract.symbol)
 
         if not current_contract:
             logger.warning(f"Could not find current contract price for {ticker}")
@@ -620,35 +604,25 @@ class VolatileStockMomentumStrategy:
         current_price = current_contract.mid_price
         pnl_percent = ((current_price - entry_price) / entry_price) * 100
 
-        # Exit conditions
-        should_exit = False
-        exit_reason = ""
-
-        # Trailing stop
+        # Exit conditions, end of day first; the trailing stop still runs
+        # every tick to track its high-water mark
+        trail_exit = False
+        trail_price = 0.0
         if self.config.use_trailing_stop:
-            should_trail_exit, trail_price = self.manage_trailing_stop(current_price, entry_price)
-            if should_trail_exit:
-                should_exit = True
-                exit_reason = f"Trailing stop hit at ${trail_price:.2f} ({pnl_percent:.1f}%)"
-
-        # Stop loss
-        if not should_exit and pnl_percent <= -self.config.stop_loss_percent:
-            should_exit = True
-            exit_reason = f"Stop loss hit ({pnl_percent:.1f}%)"
-
-        # Take profit
-        if not should_exit and pnl_percent >= self.config.take_profit_percent:
-            should_exit = True
-            exit_reason = f"Take profit hit ({pnl_percent:.1f}%)"
+            trail_exit, trail_price = self.manage_trailing_stop(current_price, entry_price)
 
-        # Time-based exit
-        current_time = datetime.now().strftime("%H:%M")
-        if current_time >= "15:55":
-            should_exit = True
+        if self.eod_exit_due():
             exit_reason = "End of day exit"
+        elif trail_exit:
+            exit_reason = f"Trailing stop hit at ${trail_price:.2f} ({pnl_percent:.1f}%)"
+        elif pnl_percent <= self._sl_threshold:
+            exit_reason = f"Stop loss hit ({pnl_percent:.1f}%)"
+        elif pnl_percent >= self._tp_threshold:
+            exit_reason = f"Take profit hit ({pnl_percent:.1f}%)"
+        else:
+            return
 
-        if should_exit:
-            await self._close_position(current_contract, exit_reason)
+        await self._close_position(current_contract, exit_reason)
 
     async def _close_position(self, contract: OptionContract, reason: str):
         """Close position"""
@@ -713,22 +687,25 @@ class VolatileStockMomentumStrategy:
         logger.info(f"Risk: TP={self.config.take_profit_percent}%, SL={self.config.stop_loss_percent}%")
 
         self.running = True
-        last_heartbeat = 0
-        heartbeat_interval = 300
+
+        # Periodic heartbeat, driven by the loop's timer
+        self._heartbeat_handle = asyncio.get_running_loop().call_later(
+            HEARTBEAT_INTERVAL, self._emit_heartbeat)
 
         while self.running:
             try:
-                current_time = time.time()
-
-                # Periodic heartbeat
-                if current_time - last_heartbeat >= heartbeat_interval:
-                    if self._is_trading_hours():
-                        status = "Scanning tickers" if not self.current_position else f"In position ({self.current_ticker})"
-                        logger.info(f"[Heartbeat] {status} | Active: {self.active_ticker or 'None'}")
-                    last_heartbeat = current_time
-
-                # Get quotes for all tickers
-                snapshots = await self.client.get_quotes_batch(self.config.tickers)
+                current_time = time.monotonic()
+
+                # Get quotes for all tickers; an open position is managed
+                # alongside the fetch (it prices off the option chain)
+                in_position = self.current_position is not None
+                if in_position:
+                    snapshots, _ = await asyncio.gather(
+                        self.client.get_quotes_batch(self.config.tickers),
+                        self.manage_position()
+                    )
+                else:
+                    snapshots = await self.client.get_quotes_batch(self.config.tickers)
 
                 if not snapshots:
                     await asyncio.sleep(1)
@@ -736,10 +713,10 @@ class VolatileStockMomentumStrategy:
 
                 # Store price history
                 for symbol, snap in snapshots.items():
-                    self.price_history[symbol].append(snap)
+                    self.price_history[symbol].push(snap)
 
                 # If no position: scan for best ticker and check signals
-                if not self.current_position:
+                if not in_position:
                     # Re-scan periodically for best ticker
                     if current_time - self.last_scan_time >= self.config.scan_interval_seconds:
                         self.active_ticker = await self.scan_best_ticker(snapshots)
@@ -752,11 +729,10 @@ class VolatileStockMomentumStrategy:
                         if signal:
                             await self.execute_signal(self.active_ticker, signal, snap.price)
 
-                # Manage existing position
-                if self.current_position:
-                    await self.manage_position()
-
-                await asyncio.sleep(0.05)
+                if in_position:
+                    await asyncio.sleep(self.config.poll_interval_active)
+                else:
+                    await asyncio.sleep(self.config.poll_interval_idle)
 
             except Exception as e:
                 logger.error(f"Error in trading loop: {type(e).__name__}: {e}", exc_info=True)
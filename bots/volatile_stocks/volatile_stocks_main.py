@@ -13,7 +13,7 @@ import argparse
 import logging
 import signal
 import sys
-from datetime import datetime, time as dt_time
+from datetime import datetime, timedelta, time as dt_time
 from typing import Optional
 
 # Import bot components
@@ -175,25 +175,13 @@ class VolatileStockTradingApp:
     def _time_until_market_open(self) -> Optional[float]:
         """Calculate seconds until market opens"""
         now = datetime.now()
-
-        # Calculate next market open
+        weekday = now.weekday()
         next_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
 
-        if now.time() >= dt_time(16, 0) or now.weekday() >= 5:
-            from datetime import timedelta
-            # After close or weekend
-            if now.weekday() == 4:  # Friday after close
-                days_until_monday = 3
-            elif now.weekday() == 5:  # Saturday
-                days_until_monday = 2
-            elif now.weekday() == 6:  # Sunday
-                days_until_monday = 1
-            else:
-                days_until_monday = 1
-
-            next_open = (now + timedelta(days=days_until_monday)).replace(
-                hour=9, minute=30, second=0, microsecond=0
-            )
+        # After the close or on a weekend: the next weekday's open
+        # (Mon-Thu -> tomorrow, Fri -> +3, Sat -> +2, Sun -> +1)
+        if weekday >= 5 or now.time() >= dt_time(16, 0):
+            next_open += timedelta(days=1 if weekday < 4 else 7 - weekday)
 
         return (next_open - now).total_seconds()
 
@@ -259,7 +247,7 @@ def setup_signal_handlers(app: VolatileStockTradingApp, loop: asyncio.AbstractEv
         try:
             loop.add_signal_handler(sig, signal_handler)
         except NotImplementedError:
-            signal.signal(sig, lambda s, f: signal_handler())
+            signal.signal(sig, lambda s, f: loop.call_soon_threadsafe(signal_handler))
 
 
 async def main_async(args):
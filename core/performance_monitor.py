@@ -3,23 +3,31 @@ Performance Monitoring and Risk Management Module
 Real-time tracking of trading metrics and risk controls
 """
 
+import math
+import sys
 import time
 import numpy as np
-import pandas as pd
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import deque
+from array import array
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+EQUITY_CAPACITY = 10000  # Equity curve points retained for drawdown
+LATENCY_CAPACITY = 1000  # Latency samples retained for stats
+TICK_RATE_BATCH = 1024  # Ticks between tick-rate clock reads (power of two)
+TICK_RATE_ALPHA = 0.1  # EWMA weight of the newest tick-rate sample
+_ANNUALIZE = math.sqrt(252.0)  # Trading days per year
+
+@dataclass(slots=True)
 class TradeMetrics:
     """Metrics for a single trade"""
-    entry_time: float
-    exit_time: Optional[float] = None
+    entry_time: int  # time.monotonic_ns()
+    exit_time: Optional[int] = None
     entry_price: float = 0.0
     exit_price: Optional[float] = None
     side: str = ""  # BUY or SELL
@@ -30,6 +38,10 @@ class TradeMetrics:
     max_adverse_excursion: float = 0.0  # MAE
     latency_ms: float = 0.0
     slippage_ticks: float = 0.0
+    side_sign: float = field(default=1.0, init=False)  # +1 BUY, -1 SELL
+    
+    def __post_init__(self):
+        self.side_sign = 1.0 if self.side == "BUY" else -1.0
 
 @dataclass
 class PerformanceStats:
@@ -92,13 +104,20 @@ class RiskManager:
         self.consecutive_losses = 0
         self.is_trading_allowed = True
         self.risk_violations = []
+        self._dirty = True  # Set on any change the dashboard reports
         
         # Position tracking
         self.open_positions: Dict[str, TradeMetrics] = {}
         self.closed_trades: List[TradeMetrics] = []
         
-        # Performance tracking
-        self.equity_curve = deque(maxlen=10000)
+        # Closed-trade P&L column, grown by doubling (avoids per-report DataFrame)
+        self._pnl_arr = np.empty(1024, dtype=np.float64)
+        self._closed_n = 0
+        
+        # Performance tracking - equity ring is written twice so the last
+        # EQUITY_CAPACITY points are always one contiguous slice
+        self._equity_buf = np.empty(2 * EQUITY_CAPACITY, dtype=np.float64)
+        self._equity_writes = 0
         self.peak_equity = 0.0
         self.current_drawdown = 0.0
         
@@ -116,6 +135,7 @@ class RiskManager:
         # Check daily loss limit
         if self.daily_pnl <= -self.max_daily_loss:
             self.is_trading_allowed = False
+            self._dirty = True
             return False, f"Daily loss limit reached: ${self.daily_pnl:.2f}"
         
         # Check position size
@@ -129,6 +149,7 @@ class RiskManager:
         # Check consecutive losses
         if self.consecutive_losses >= self.max_consecutive_losses:
             self.is_trading_allowed = False
+            self._dirty = True
             return False, f"Consecutive loss limit reached: {self.consecutive_losses}"
         
         # Check risk per trade
@@ -148,18 +169,11 @@ class RiskManager:
         trade = self.open_positions[trade_id]
         
         # Calculate current P&L
-        if trade.side == "BUY":
-            price_diff = current_price - trade.entry_price
-        else:  # SELL
-            price_diff = trade.entry_price - current_price
-        
-        pnl_ticks = price_diff / tick_size
-        
-        # Update MFE/MAE
-        if pnl_ticks > trade.max_favorable_excursion:
-            trade.max_favorable_excursion = pnl_ticks
-        if pnl_ticks < -trade.max_adverse_excursion:
-            trade.max_adverse_excursion = abs(pnl_ticks)
+        pnl_ticks = trade.side_sign * (current_price - trade.entry_price) / tick_size
+        
+        # Update MFE/MAE (MAE is stored as a positive magnitude)
+        trade.max_favorable_excursion = max(trade.max_favorable_excursion, pnl_ticks)
+        trade.max_adverse_excursion = max(trade.max_adverse_excursion, -pnl_ticks)
     
     def close_trade(self, trade_id: str, 
                    exit_price: float, 
@@ -172,14 +186,11 @@ class RiskManager:
             return None
         
         trade = self.open_positions.pop(trade_id)
-        trade.exit_time = time.time()
+        trade.exit_time = time.monotonic_ns()
         trade.exit_price = exit_price
         
         # Calculate P&L
-        if trade.side == "BUY":
-            pnl_ticks = (exit_price - trade.entry_price) / tick_value
-        else:  # SELL
-            pnl_ticks = (trade.entry_price - exit_price) / tick_value
+        pnl_ticks = trade.side_sign * (exit_price - trade.entry_price) / tick_value
         
         trade.pnl_ticks = pnl_ticks
         trade.pnl = (pnl_ticks * tick_value * trade.quantity) - commission
@@ -195,16 +206,39 @@ class RiskManager:
         
         # Add to closed trades
         self.closed_trades.append(trade)
+        if self._closed_n == len(self._pnl_arr):
+            self._pnl_arr = np.resize(self._pnl_arr, 2 * len(self._pnl_arr))
+        self._pnl_arr[self._closed_n] = trade.pnl
+        self._closed_n += 1
         self.trades_today += 1
         
         # Update equity curve
-        self.equity_curve.append(self.daily_pnl)
+        pos = self._equity_writes % EQUITY_CAPACITY
+        self._equity_buf[pos] = self._equity_buf[pos + EQUITY_CAPACITY] = self.daily_pnl
+        self._equity_writes += 1
+        self._dirty = True
         
         logger.info(f"Trade closed: {trade.side} P&L: ${trade.pnl:.2f} "
                    f"({trade.pnl_ticks:.1f} ticks)")
         
         return trade
     
+    def _equity_view(self) -> np.ndarray:
+        """Equity curve (oldest first) as a contiguous view over the ring"""
+        if self._equity_writes < EQUITY_CAPACITY:
+            return self._equity_buf[:self._equity_writes]
+        start = self._equity_writes % EQUITY_CAPACITY
+        return self._equity_buf[start:start + EQUITY_CAPACITY]
+    
+    @property
+    def equity_curve(self) -> np.ndarray:
+        """Most recent EQUITY_CAPACITY equity points"""
+        return self._equity_view()
+    
+    def pnl_view(self) -> np.ndarray:
+        """P&L of closed trades as a view over the preallocated buffer"""
+        return self._pnl_arr[:self._closed_n]
+    
     def calculate_position_size(self, account_balance: float,
                               stop_loss_ticks: int,
                               tick_value: float) -> int:
@@ -231,6 +265,7 @@ class RiskManager:
         self.trades_today = 0
         self.consecutive_losses = 0
         self.is_trading_allowed = True
+        self._dirty = True
         logger.info("Daily risk metrics reset")
 
 class PerformanceMonitor:
@@ -245,65 +280,93 @@ class PerformanceMonitor:
         self.stats = PerformanceStats()
         
         # Latency tracking
-        self.latency_samples = deque(maxlen=1000)
-        self.order_timestamps: Dict[str, float] = {}
+        self._lat_buf = array('q', bytes(8 * LATENCY_CAPACITY))  # ns ring
+        self._lat_head = 0
+        self._lat_n = 0
+        self.order_timestamps: Dict[str, int] = {}
+        self._latency_dirty = False  # Stats are refreshed at report time
         
         # Real-time metrics
         self.tick_count = 0
-        self.last_tick_time = time.time()
+        self.last_tick_time = time.monotonic_ns()
         self.ticks_per_second = 0.0
+        self._tick_mask = TICK_RATE_BATCH - 1
+        
+        # Report subcomputations touch disjoint data, so they fan out
+        self._report_executor = ThreadPoolExecutor(max_workers=4,
+                                                   thread_name_prefix="perf-report")
+        
+        # Labels never change, so the dashboard layout is built once
+        self._dashboard_template = self._build_dashboard_template()
+        self._dashboard_cache = ""
+        self._dashboard_open_positions = 0
+        self._dirty = True
+        
+        # Reusable drawdown workspace
+        self._cum_buf = np.empty(EQUITY_CAPACITY, dtype=np.float64)
+        self._peak_buf = np.empty(EQUITY_CAPACITY, dtype=np.float64)
         
     def record_order_sent(self, order_id: str):
         """Record when order was sent"""
-        self.order_timestamps[order_id] = time.perf_counter()
+        self.order_timestamps[order_id] = time.monotonic_ns()
     
     def record_order_filled(self, order_id: str) -> float:
         """Record order fill and calculate latency"""
-        if order_id in self.order_timestamps:
-            latency_ms = (time.perf_counter() - self.order_timestamps[order_id]) * 1000
-            self.latency_samples.append(latency_ms)
-            del self.order_timestamps[order_id]
-            
-            # Update stats
-            if self.latency_samples:
-                self.stats.avg_latency_ms = np.mean(self.latency_samples)
-                self.stats.max_latency_ms = np.max(self.latency_samples)
+        sent_ns = self.order_timestamps.pop(order_id, None)
+        if sent_ns is not None:
+            latency_ns = time.monotonic_ns() - sent_ns
+            self._lat_buf[self._lat_head] = latency_ns
+            self._lat_head = (self._lat_head + 1) % LATENCY_CAPACITY
+            self._lat_n = min(self._lat_n + 1, LATENCY_CAPACITY)
+            self._latency_dirty = True
+            self._dirty = True
             
-            return latency_ms
+            return latency_ns * 1e-6
         return 0.0
     
+    def _lat_view(self) -> np.ndarray:
+        """Retained latency samples (ns) as a zero-copy view, in slot order"""
+        return np.frombuffer(self._lat_buf, dtype=np.int64)[:self._lat_n]
+    
     def update_tick_rate(self):
-        """Update tick processing rate"""
+        """Update tick processing rate (EWMA, clock sampled every TICK_RATE_BATCH ticks)"""
         self.tick_count += 1
-        current_time = time.time()
+        if self.tick_count & self._tick_mask:
+            return
         
-        if current_time - self.last_tick_time >= 1.0:
-            self.ticks_per_second = self.tick_count / (current_time - self.last_tick_time)
-            self.tick_count = 0
-            self.last_tick_time = current_time
+        current_time = time.monotonic_ns()
+        elapsed_ns = current_time - self.last_tick_time
+        self.last_tick_time = current_time
+        if elapsed_ns <= 0:
+            return
+        
+        rate = TICK_RATE_BATCH * 1e9 / elapsed_ns
+        if self.ticks_per_second:
+            rate = (1 - TICK_RATE_ALPHA) * self.ticks_per_second + TICK_RATE_ALPHA * rate
+        self.ticks_per_second = rate
+        self._dirty = True
     
-    def calculate_sharpe_ratio(self, returns: List[float], 
+    def calculate_sharpe_ratio(self, returns: np.ndarray, 
                               risk_free_rate: float = 0.02) -> float:
         """Calculate Sharpe ratio"""
-        if not returns or len(returns) < 2:
+        if len(returns) < 2:
             return 0.0
         
-        returns_array = np.array(returns)
-        excess_returns = returns_array - (risk_free_rate / 252)  # Daily risk-free rate
+        excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free rate
+        std = np.std(excess_returns)
         
-        if np.std(excess_returns) == 0:
+        if std == 0:
             return 0.0
         
-        return np.sqrt(252) * np.mean(excess_returns) / np.std(excess_returns)
+        return _ANNUALIZE * np.mean(excess_returns) / std
     
-    def calculate_sortino_ratio(self, returns: List[float],
+    def calculate_sortino_ratio(self, returns: np.ndarray,
                                target_return: float = 0.0) -> float:
         """Calculate Sortino ratio (downside deviation)"""
-        if not returns or len(returns) < 2:
+        if len(returns) < 2:
             return 0.0
         
-        returns_array = np.array(returns)
-        downside_returns = returns_array[returns_array < target_return]
+        downside_returns = returns[returns < target_return]
         
         if len(downside_returns) == 0:
             return 0.0
@@ -312,51 +375,84 @@ class PerformanceMonitor:
         if downside_deviation == 0:
             return 0.0
         
-        return np.sqrt(252) * (np.mean(returns_array) - target_return) / downside_deviation
+        return _ANNUALIZE * (np.mean(returns) - target_return) / downside_deviation
     
     def calculate_max_drawdown(self) -> Tuple[float, float]:
         """Calculate maximum drawdown"""
-        if not self.risk_manager.equity_curve:
+        equity = self.risk_manager._equity_view()
+        n = len(equity)
+        if n == 0:
             return 0.0, 0.0
         
-        equity = np.array(self.risk_manager.equity_curve)
-        cumulative = np.cumsum(equity)
-        running_max = np.maximum.accumulate(cumulative)
-        drawdown = cumulative - running_max
+        cumulative = np.cumsum(equity, out=self._cum_buf[:n])
+        running_max = np.maximum.accumulate(cumulative, out=self._peak_buf[:n])
+        drawdown = np.subtract(cumulative, running_max, out=cumulative)
         
-        max_dd = np.min(drawdown)
-        max_dd_pct = (max_dd / running_max[np.argmin(drawdown)]) * 100 if running_max[np.argmin(drawdown)] != 0 else 0
+        trough = np.argmin(drawdown)
+        max_dd = drawdown[trough]
+        max_dd_pct = (max_dd / running_max[trough]) * 100 if running_max[trough] != 0 else 0
         
         return max_dd, max_dd_pct
     
+    def _compute_pnl_stats(self, pnl: np.ndarray) -> Dict:
+        """Aggregate win/loss counts and gross P&L over closed trades"""
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        
+        return {
+            'total_trades': len(pnl),
+            'winning_trades': len(wins),
+            'losing_trades': len(losses),
+            'gross_profit': float(wins.sum()),
+            'gross_loss': float(losses.sum())
+        }
+    
+    def _compute_risk_ratios(self, pnl: np.ndarray) -> Tuple[float, float]:
+        """Sharpe and Sortino ratios over per-trade returns"""
+        if len(pnl) < 2:
+            return self.stats.sharpe_ratio, self.stats.sortino_ratio
+        
+        return self.calculate_sharpe_ratio(pnl), self.calculate_sortino_ratio(pnl)
+    
+    def _compute_drawdown(self) -> Tuple[float, float]:
+        """Max drawdown over the equity curve"""
+        return self.calculate_max_drawdown()
+    
+    def _compute_latency(self) -> Tuple[float, float]:
+        """Average and max order latency"""
+        if not self._latency_dirty:
+            return self.stats.avg_latency_ms, self.stats.max_latency_ms
+        
+        self._latency_dirty = False
+        samples_ns = self._lat_view()
+        return float(np.mean(samples_ns)) * 1e-6, float(np.max(samples_ns)) * 1e-6
+    
     def generate_performance_report(self) -> Dict:
         """Generate comprehensive performance report"""
         
+        # Later closes write past the end of this view, so it stays consistent
+        pnl = self.risk_manager.pnl_view()
+        
+        latency_future = self._report_executor.submit(self._compute_latency)
+        
         # Calculate statistics from closed trades
-        if self.risk_manager.closed_trades:
-            trades_df = pd.DataFrame([
-                {
-                    'pnl': t.pnl,
-                    'pnl_ticks': t.pnl_ticks,
-                    'mfe': t.max_favorable_excursion,
-                    'mae': t.max_adverse_excursion,
-                    'duration': (t.exit_time - t.entry_time) if t.exit_time else 0,
-                    'side': t.side
-                }
-                for t in self.risk_manager.closed_trades
-            ])
+        if len(pnl):
+            pnl_future = self._report_executor.submit(self._compute_pnl_stats, pnl)
+            ratios_future = self._report_executor.submit(self._compute_risk_ratios, pnl)
+            drawdown_future = self._report_executor.submit(self._compute_drawdown)
             
             # Update performance stats
-            self.stats.total_trades = len(trades_df)
-            self.stats.winning_trades = len(trades_df[trades_df['pnl'] > 0])
-            self.stats.losing_trades = len(trades_df[trades_df['pnl'] < 0])
+            pnl_stats = pnl_future.result()
+            self.stats.total_trades = pnl_stats['total_trades']
+            self.stats.winning_trades = pnl_stats['winning_trades']
+            self.stats.losing_trades = pnl_stats['losing_trades']
             
             if self.stats.winning_trades > 0:
-                self.stats.gross_profit = trades_df[trades_df['pnl'] > 0]['pnl'].sum()
+                self.stats.gross_profit = pnl_stats['gross_profit']
                 self.stats.avg_win = self.stats.gross_profit / self.stats.winning_trades
             
             if self.stats.losing_trades > 0:
-                self.stats.gross_loss = trades_df[trades_df['pnl'] < 0]['pnl'].sum()
+                self.stats.gross_loss = pnl_stats['gross_loss']
                 self.stats.avg_loss = self.stats.gross_loss / self.stats.losing_trades
             
             self.stats.net_profit = self.stats.gross_profit + self.stats.gross_loss
@@ -365,14 +461,11 @@ class PerformanceMonitor:
             # Calculate derived metrics
             self.stats.calculate_derived_metrics()
             
-            # Calculate Sharpe and Sortino ratios
-            if len(trades_df) > 1:
-                returns = trades_df['pnl'].values
-                self.stats.sharpe_ratio = self.calculate_sharpe_ratio(returns.tolist())
-                self.stats.sortino_ratio = self.calculate_sortino_ratio(returns.tolist())
-            
-            # Calculate max drawdown
-            self.stats.max_drawdown, self.stats.max_drawdown_pct = self.calculate_max_drawdown()
+            # Sharpe/Sortino and max drawdown
+            self.stats.sharpe_ratio, self.stats.sortino_ratio = ratios_future.result()
+            self.stats.max_drawdown, self.stats.max_drawdown_pct = drawdown_future.result()
+        
+        self.stats.avg_latency_ms, self.stats.max_latency_ms = latency_future.result()
         
         # Create report
         report = {
@@ -406,35 +499,66 @@ class PerformanceMonitor:
         
         return report
     
+    _DASHBOARD_SECTIONS = (
+        ("📊 PERFORMANCE METRICS:", 'performance',
+         ('total_trades', 'win_rate', 'profit_factor', 'net_profit', 'avg_win',
+          'avg_loss', 'max_drawdown', 'max_drawdown_pct', 'sharpe_ratio', 'sortino_ratio')),
+        ("⚡ EXECUTION QUALITY:", 'execution',
+         ('avg_latency_ms', 'max_latency_ms', 'ticks_per_second', 'total_commission')),
+        ("⚠️  RISK STATUS:", 'risk',
+         ('daily_pnl', 'trades_today', 'consecutive_losses', 'open_positions', 'trading_allowed')),
+    )
+    
+    @classmethod
+    def _build_dashboard_template(cls) -> str:
+        """Build the dashboard as a single format_map template"""
+        lines = ["", "="*60, "           TRADING PERFORMANCE DASHBOARD", "="*60]
+        
+        for title, section, keys in cls._DASHBOARD_SECTIONS:
+            lines.append("\n" + title)
+            for key in keys:
+                label = key.replace('_', ' ').title()
+                if key == 'trading_allowed':
+                    lines.append(f" {{trading_allowed_status}} {label}: {{{key}}}")
+                elif section == 'risk':
+                    lines.append(f"    {label}: {{{key}}}")
+                else:
+                    lines.append(f"   {label}: {{{key}}}")
+        
+        lines.append("\n" + "="*60)
+        return "\n".join(lines) + "\n"
+    
     def print_live_dashboard(self):
         """Print live performance dashboard"""
-        report = self.generate_performance_report()
-        
-        print("\n" + "="*60)
-        print("           TRADING PERFORMANCE DASHBOARD")
-        print("="*60)
-        
-        print("\n📊 PERFORMANCE METRICS:")
-        for key, value in report['performance'].items():
-            print(f"   {key.replace('_', ' ').title()}: {value}")
-        
-        print("\n⚡ EXECUTION QUALITY:")
-        for key, value in report['execution'].items():
-            print(f"   {key.replace('_', ' ').title()}: {value}")
-        
-        print("\n⚠️  RISK STATUS:")
-        for key, value in report['risk'].items():
-            status = "✅" if key == 'trading_allowed' and value else "🔴" if key == 'trading_allowed' else "  "
-            print(f" {status} {key.replace('_', ' ').title()}: {value}")
+        # Positions are opened by writing to open_positions directly, so
+        # their count is checked alongside the dirty flags
+        open_positions = len(self.risk_manager.open_positions)
+        if (self._dirty or self.risk_manager._dirty
+                or open_positions != self._dashboard_open_positions):
+            report = self.generate_performance_report()
+            
+            fields = {**report['performance'], **report['execution'], **report['risk']}
+            fields['trading_allowed_status'] = "✅" if fields['trading_allowed'] else "🔴"
+            
+            self._dashboard_cache = self._dashboard_template.format_map(fields)
+            self._dashboard_open_positions = open_positions
+            self._dirty = False
+            self.risk_manager._dirty = False
         
-        print("\n" + "="*60)
+        sys.stdout.write(self._dashboard_cache)
         
+async def _print_dashboard_forever(monitor: PerformanceMonitor, interval_seconds: int):
+    """Dashboard loop body, kept free of per-iteration exception handling"""
+    while True:
+        monitor.print_live_dashboard()
+        await asyncio.sleep(interval_seconds)
+
 async def performance_monitoring_loop(monitor: PerformanceMonitor, interval_seconds: int = 10):
     """Async loop for periodic performance monitoring"""
+    # Errors are caught at this boundary and the inner loop is restarted
     while True:
         try:
-            monitor.print_live_dashboard()
-            await asyncio.sleep(interval_seconds)
+            await _print_dashboard_forever(monitor, interval_seconds)
         except Exception as e:
             logger.error(f"Error in performance monitoring: {e}")
             await asyncio.sleep(interval_seconds)
@@ -446,7 +570,7 @@ if __name__ == "__main__":
     
     # Simulate some trades
     risk_mgr.open_positions["trade1"] = TradeMetrics(
-        entry_time=time.time(),
+        entry_time=time.monotonic_ns(),
         entry_price=5000.0,
         side="BUY"
     )
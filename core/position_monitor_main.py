@@ -15,6 +15,7 @@ Usage:
 import asyncio
 import argparse
 import logging
+import os
 import signal
 import sys
 from typing import Optional
@@ -36,6 +37,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Loop-level signal handlers are only available on POSIX event loops
+_IS_POSIX = os.name == 'posix'
+
 
 def show_config():
     """Display current configuration"""
@@ -70,11 +74,17 @@ def setup_signal_handlers(app: PositionMonitorApp, loop: asyncio.AbstractEventLo
         logger.info("Received shutdown signal")
         asyncio.create_task(app.shutdown())
 
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        try:
+    if _IS_POSIX:
+        for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, signal_handler)
-        except NotImplementedError:
-            signal.signal(sig, lambda s, f: signal_handler())
+    else:
+        # Windows doesn't support add_signal_handler
+        def fallback_handler(signum, frame):
+            # Runs between bytecodes, possibly mid-callback; defer to the loop
+            loop.call_soon_threadsafe(signal_handler)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, fallback_handler)
 
 
 async def main_async(args):
@@ -5,23 +5,83 @@ Prevents margin calls, PDT violations, and oversized positions
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, date, timedelta
 from typing import Optional, Tuple
 from dataclasses import dataclass
-from collections import deque
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
+# Day-trade exit times kept for the PDT check. The rule looks back 5 days
+# and blocks at 3, so a few slots cover it; the oldest is overwritten.
+DAY_TRADE_RING_SIZE = 8
+PDT_WINDOW = timedelta(days=5)
 
-@dataclass
+
+class AcctType(IntEnum):
+    """Account type, compared by identity on the pre-trade checks"""
+    CASH = 0
+    MARGIN = 1
+
+    def __str__(self) -> str:
+        return self.name
+
+
+@dataclass(slots=True, frozen=True)
 class AccountInfo:
     """Account balance and position information"""
     cash_available: float
     buying_power: float
-    account_type: str  # "CASH" or "MARGIN"
+    account_type: AcctType  # Schwab's "CASH"/"MARGIN" strings are accepted
     account_value: float
     positions_value: float = 0.0
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.account_type, AcctType):
+            # Schwab reports "CASH" or "MARGIN"; anything else is held to margin rules
+            object.__setattr__(self, "account_type",
+                               AcctType.CASH if self.account_type == "CASH" else AcctType.MARGIN)
+
+
+def _next_midnight(now: float) -> float:
+    """Epoch of the local midnight following `now`"""
+    local = time.localtime(now)
+    return time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+
+class _DayTradeRing:
+    """Fixed-capacity ring of day-trade exit times, oldest first"""
+
+    buf: list
+    head: int
+    tail: int
+    cap: int
+
+    def __init__(self, cap: int = DAY_TRADE_RING_SIZE) -> None:
+        self.buf: list = [None] * cap
+        self.head = 0  # Absolute index of the oldest entry
+        self.tail = 0  # Absolute index one past the newest entry
+        self.cap = cap
+
+    def __len__(self) -> int:
+        return self.tail - self.head
+
+    def append(self, ts: datetime) -> None:
+        self.buf[self.tail % self.cap] = ts
+        self.tail += 1
+        if self.tail - self.head > self.cap:
+            self.head += 1
+
+    def oldest(self) -> Optional[datetime]:
+        return self.buf[self.head % self.cap] if self.tail > self.head else None
+
+    def expire(self, cutoff: datetime) -> None:
+        """Drop entries at or before cutoff (entries are in time order)"""
+        buf, cap = self.buf, self.cap
+        while self.head < self.tail and buf[self.head % cap] <= cutoff:
+            self.head += 1
+
 
 class AccountSafetyManager:
     """
@@ -32,34 +92,74 @@ class AccountSafetyManager:
     - Position sizing beyond safe limits
     """
 
+    # Declared up front so a compiler such as mypyc can give each one a
+    # native slot instead of a boxed instance-dict entry
+    max_position_cost_percent: float
+    max_daily_loss_dollars: float
+    max_daily_trades: int
+    cash_account_buffer: float
+    _max_position_fraction: float
+    daily_trades: int
+    daily_pnl: float
+    last_reset_date: date
+    _next_reset_epoch: float
+    day_trades: _DayTradeRing
+    _pdt_count_cached: int
+    _pdt_cache_expires_at: datetime
+
     def __init__(self,
                  max_position_cost_percent: float = 20.0,  # Max 20% of account per trade
                  max_daily_loss_dollars: float = 100.0,    # Stop if lose $100 in a day
                  max_daily_trades: int = 3,                # For PDT safety
-                 cash_account_buffer: float = 50.0):       # Keep $50 cash buffer
+                 cash_account_buffer: float = 50.0) -> None:  # Keep $50 cash buffer
 
         self.max_position_cost_percent = max_position_cost_percent
         self.max_daily_loss_dollars = max_daily_loss_dollars
         self.max_daily_trades = max_daily_trades
         self.cash_account_buffer = cash_account_buffer
+        self._max_position_fraction = max_position_cost_percent / 100.0
 
         # Track today's activity
         self.daily_trades = 0
         self.daily_pnl = 0.0
         self.last_reset_date = datetime.now().date()
+        self._next_reset_epoch = _next_midnight(time.time())
 
-        # Track recent day trades (for PDT)
-        self.day_trades: deque = deque(maxlen=100)  # Last 100 trades
+        # Track recent day trades (for PDT). The in-window count only
+        # changes on a new day trade or when the oldest one ages out, so it
+        # is cached until then.
+        self.day_trades = _DayTradeRing()
+        self._pdt_count_cached = 0
+        self._pdt_cache_expires_at = datetime.max
 
-    def reset_daily_counters(self):
+    def reset_daily_counters(self) -> None:
         """Reset counters at start of new day"""
-        today = datetime.now().date()
+        # Same day as the last check (the common case): one float compare
+        now = time.time()
+        if now < self._next_reset_epoch:
+            return
+        self._next_reset_epoch = _next_midnight(now)
+
+        today = date.fromtimestamp(now)
         if today != self.last_reset_date:
             logger.info(f"New trading day - resetting counters. Previous P&L: ${self.daily_pnl:.2f}")
             self.daily_trades = 0
             self.daily_pnl = 0.0
             self.last_reset_date = today
 
+    def _refresh_pdt_count(self, now: datetime) -> None:
+        """Expire day trades older than 5 days and re-cache the count"""
+        self.day_trades.expire(now - PDT_WINDOW)
+        self._pdt_count_cached = len(self.day_trades)
+        oldest = self.day_trades.oldest()
+        self._pdt_cache_expires_at = oldest + PDT_WINDOW if oldest else datetime.max
+
+    def _pdt_count(self, now: datetime) -> int:
+        """Day trades in the last 5 days, recounted only after one expires"""
+        if now >= self._pdt_cache_expires_at:
+            self._refresh_pdt_count(now)
+        return self._pdt_count_cached
+
     def can_trade(self, account_info: AccountInfo, option_cost: float) -> Tuple[bool, str]:
         """
         Comprehensive safety check before placing a trade
@@ -95,7 +195,7 @@ class AccountSafetyManager:
         """Check if account has enough cash to buy the option"""
 
         # For CASH accounts: need actual cash available
-        if account_info.account_type == "CASH":
+        if account_info.account_type is AcctType.CASH:
             required = option_cost * 100  # Options are per contract ($2.50 option = $250)
             available = account_info.cash_available - self.cash_account_buffer
 
@@ -117,7 +217,7 @@ class AccountSafetyManager:
         """Ensure position isn't too large relative to account size"""
 
         position_cost = option_cost * 100  # $2.50 option = $250
-        max_allowed = account_info.account_value * (self.max_position_cost_percent / 100)
+        max_allowed = account_info.account_value * self._max_position_fraction
 
         if position_cost > max_allowed:
             return True, (f"Position too large: ${position_cost:.2f} exceeds "
@@ -143,24 +243,24 @@ class AccountSafetyManager:
         """
 
         # PDT only applies to margin accounts under $25k
-        if account_info.account_type == "MARGIN" and account_info.account_value < 25000:
-            # Count day trades in last 5 trading days
-            five_days_ago = datetime.now() - timedelta(days=5)
-            recent_day_trades = [dt for dt in self.day_trades if dt > five_days_ago]
+        if account_info.account_type is AcctType.MARGIN and account_info.account_value < 25000:
+            # Count day trades in last 5 trading days (cached until one expires)
+            now = datetime.now()
+            recent_count = self._pdt_count(now)
 
-            if len(recent_day_trades) >= 3:
-                return True, (f"PDT limit reached: {len(recent_day_trades)} day trades "
-                            f"in last 5 days (limit: 3). Wait {(recent_day_trades[0] - five_days_ago).days} days.")
+            if recent_count >= 3:
+                return True, (f"PDT limit reached: {recent_count} day trades "
+                            f"in last 5 days (limit: 3). Wait {(self._pdt_cache_expires_at - now).days} days.")
 
         # For CASH accounts: warn about trade frequency
-        if account_info.account_type == "CASH":
+        if account_info.account_type is AcctType.CASH:
             if self.daily_trades >= self.max_daily_trades:
                 return True, (f"Cash account trade limit: {self.daily_trades} trades today "
                             f"(limit: {self.max_daily_trades}). Cash may not be settled.")
 
         return False, "PDT check OK"
 
-    def record_trade(self, entry_time: datetime, exit_time: datetime, pnl: float):
+    def record_trade(self, entry_time: datetime, exit_time: datetime, pnl: float) -> None:
         """
         Record a completed trade for tracking
 
@@ -177,7 +277,8 @@ class AccountSafetyManager:
         # If entry and exit on same day = day trade
         if entry_time.date() == exit_time.date():
             self.day_trades.append(exit_time)
-            logger.info(f"Day trade recorded. Total in last 5 days: {len(self.day_trades)}")
+            self._refresh_pdt_count(datetime.now())
+            logger.info(f"Day trade recorded. Total in last 5 days: {self._pdt_count_cached}")
 
         logger.info(f"Trade recorded: P&L ${pnl:.2f} | Daily total: ${self.daily_pnl:.2f} | Trades today: {self.daily_trades}")
 
@@ -196,7 +297,7 @@ class AccountSafetyManager:
         cost_per_contract = option_cost * 100  # $2.50 = $250
 
         # Available funds
-        if account_info.account_type == "CASH":
+        if account_info.account_type is AcctType.CASH:
             available = account_info.cash_available - self.cash_account_buffer
         else:
             available = account_info.buying_power
@@ -205,7 +306,7 @@ class AccountSafetyManager:
         max_by_funds = int(available / cost_per_contract)
 
         # Max based on position sizing rule
-        max_position_value = account_info.account_value * (self.max_position_cost_percent / 100)
+        max_position_value = account_info.account_value * self._max_position_fraction
         max_by_sizing = int(max_position_value / cost_per_contract)
 
         # Return the smaller
@@ -220,7 +321,7 @@ class AccountSafetyManager:
         return {
             "daily_trades": self.daily_trades,
             "daily_pnl": self.daily_pnl,
-            "day_trades_last_5_days": len(self.day_trades),
+            "day_trades_last_5_days": self._pdt_count(datetime.now()),
             "max_daily_trades": self.max_daily_trades,
             "max_daily_loss": self.max_daily_loss_dollars,
             "date": self.last_reset_date.isoformat()
@@ -240,7 +341,7 @@ if __name__ == "__main__":
     account = AccountInfo(
         cash_available=700.0,
         buying_power=700.0,
-        account_type="CASH",
+        account_type=AcctType.CASH,
         account_value=700.0
     )
 
@@ -8,9 +8,13 @@ import json
 import logging
 import webbrowser
 import base64
+import ssl
+import time
+from types import MappingProxyType
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, replace
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, urlencode
 import threading
@@ -18,10 +22,31 @@ import keyring
 from cryptography.fernet import Fernet
 import yaml
 
+# Parse/emit config.yaml with libyaml when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# orjson reads and writes bytes directly (stdlib json fallback)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 logger = logging.getLogger(__name__)
 
+# How long perform_oauth_flow waits for the browser redirect before asking
+# for the URL to be pasted (Schwab login + 2FA can take a few minutes)
+OAUTH_CALLBACK_TIMEOUT = 300
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SchwabCredentials:
     """Secure storage of Schwab OAuth credentials"""
     client_id: str
@@ -30,7 +55,7 @@ class SchwabCredentials:
     redirect_uri: str = "https://127.0.0.1:8081"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptionsStrategyParameters:
     """0DTE Options trading strategy parameters - slippage-aware defaults"""
     # Timing parameters
@@ -72,7 +97,7 @@ class OptionsStrategyParameters:
     order_timeout_ms: int = 3000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UnderlyingConfig:
     """Configuration for the underlying asset"""
     symbol: str = "SPY"
@@ -84,8 +109,8 @@ class UnderlyingConfig:
     market_close: str = "16:00"
 
 
-# Predefined strategy presets - all tuned for slippage reality
-STRATEGY_PRESETS = {
+# Predefined strategy presets - all tuned for slippage reality (read-only)
+STRATEGY_PRESETS = MappingProxyType({
     "conservative": OptionsStrategyParameters(
         time_window_seconds=20,
         min_price_movement_dollars=0.75,
@@ -128,7 +153,7 @@ STRATEGY_PRESETS = {
         max_daily_trades=20,
         no_trade_after="15:15"
     )
-}
+})
 
 
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
@@ -158,6 +183,8 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
             self.send_header('Content-type', 'text/html')
             self.end_headers()
             error = params.get('error', ['Unknown error'])[0]
+            if 'error' in params:
+                self.server.auth_error = error
             self.wfile.write(f"<html><body>Error: {error}</body></html>".encode())
 
     def log_message(self, format, *args):
@@ -168,6 +195,9 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 class SchwabConfigManager:
     """Manages configuration and OAuth credentials securely"""
 
+    # One Fernet per key file, shared by every manager for that directory
+    _ciphers: Dict[Path, Fernet] = {}
+
     def __init__(self, config_dir: str = "~/.schwab_0dte_bot"):
         self.config_dir = Path(config_dir).expanduser()
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -175,23 +205,26 @@ class SchwabConfigManager:
         self.config_file = self.config_dir / "config.yaml"
         self.credentials_file = self.config_dir / ".credentials.enc"
         self.key_file = self.config_dir / ".key"
+        self._cache_file = self.config_dir / ".config.cache.json"
 
-        self._ensure_encryption_key()
+    @cached_property
+    def cipher(self) -> Fernet:
+        """Create or load encryption key (deferred until credentials are used)"""
+        cipher = self._ciphers.get(self.key_file)
+        if cipher is None:
+            if not self.key_file.exists():
+                key = Fernet.generate_key()
+                self.key_file.write_bytes(key)
+                self.key_file.chmod(0o600)
 
-    def _ensure_encryption_key(self):
-        """Create or load encryption key"""
-        if not self.key_file.exists():
-            key = Fernet.generate_key()
-            self.key_file.write_bytes(key)
-            self.key_file.chmod(0o600)
+            cipher = self._ciphers[self.key_file] = Fernet(self.key_file.read_bytes())
 
-        self.cipher = Fernet(self.key_file.read_bytes())
+        return cipher
 
     def save_credentials(self, credentials: SchwabCredentials):
         """Save encrypted credentials"""
         try:
-            cred_json = json.dumps(asdict(credentials))
-            encrypted = self.cipher.encrypt(cred_json.encode())
+            encrypted = self.cipher.encrypt(_json_dumps(asdict(credentials)))
             self.credentials_file.write_bytes(encrypted)
             self.credentials_file.chmod(0o600)
             logger.info("Schwab credentials saved securely")
@@ -207,7 +240,7 @@ class SchwabConfigManager:
 
             encrypted = self.credentials_file.read_bytes()
             decrypted = self.cipher.decrypt(encrypted)
-            cred_dict = json.loads(decrypted.decode())
+            cred_dict = _json_loads(decrypted)
 
             return SchwabCredentials(**cred_dict)
         except Exception as e:
@@ -216,37 +249,43 @@ class SchwabConfigManager:
 
     def save_credentials_to_keyring(self, credentials: SchwabCredentials):
         """Alternative: Save credentials to system keyring"""
-        keyring.set_password("schwab_0dte_bot", "client_id", credentials.client_id)
-        keyring.set_password("schwab_0dte_bot", "client_secret", credentials.client_secret)
-        keyring.set_password("schwab_0dte_bot", "refresh_token", credentials.refresh_token)
-        keyring.set_password("schwab_0dte_bot", "redirect_uri", credentials.redirect_uri)
+        # One entry for all fields: each keyring call is an IPC round trip
+        keyring.set_password("schwab_0dte_bot", "credentials_v2", _json_dumps(asdict(credentials)).decode())
         logger.info("Credentials saved to system keyring")
 
     def load_credentials_from_keyring(self) -> Optional[SchwabCredentials]:
         """Load credentials from system keyring"""
         try:
+            blob = keyring.get_password("schwab_0dte_bot", "credentials_v2")
+            if blob:
+                return SchwabCredentials(**_json_loads(blob))
+
+            # Older installs stored one entry per field; migrate on first read
             client_id = keyring.get_password("schwab_0dte_bot", "client_id")
             if not client_id:
                 return None
 
-            return SchwabCredentials(
+            credentials = SchwabCredentials(
                 client_id=client_id,
                 client_secret=keyring.get_password("schwab_0dte_bot", "client_secret"),
                 refresh_token=keyring.get_password("schwab_0dte_bot", "refresh_token"),
                 redirect_uri=keyring.get_password("schwab_0dte_bot", "redirect_uri") or "https://127.0.0.1:8081"
             )
+            self.save_credentials_to_keyring(credentials)
+            return credentials
         except Exception:
             return None
 
     def update_refresh_token(self, new_token: str, use_keyring: bool = False):
         """Update the refresh token (called when token is refreshed)"""
         if use_keyring:
-            keyring.set_password("schwab_0dte_bot", "refresh_token", new_token)
+            creds = self.load_credentials_from_keyring()
+            if creds:
+                self.save_credentials_to_keyring(replace(creds, refresh_token=new_token))
         else:
             creds = self.load_credentials()
             if creds:
-                creds.refresh_token = new_token
-                self.save_credentials(creds)
+                self.save_credentials(replace(creds, refresh_token=new_token))
 
     def save_strategy_config(self, params: OptionsStrategyParameters,
                              underlying: UnderlyingConfig,
@@ -264,17 +303,23 @@ class SchwabConfigManager:
         }
 
         with open(self.config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        self._cache_file.unlink(missing_ok=True)
 
         logger.info(f"Strategy configuration saved to {self.config_file}")
 
     def load_strategy_config(self) -> tuple[OptionsStrategyParameters, UnderlyingConfig, dict]:
         """Load strategy configuration"""
-        if not self.config_file.exists():
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             return OptionsStrategyParameters(), UnderlyingConfig(), {}
 
-        with open(self.config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        config = self._read_config_cache(stat)
+        if config is None:
+            with open(self.config_file, 'r') as f:
+                config = yaml.load(f, Loader=_YamlLoader)
+            self._write_config_cache(stat, config)
 
         params = OptionsStrategyParameters(**config.get("strategy", {}))
         underlying = UnderlyingConfig(**config.get("underlying", {}))
@@ -282,6 +327,29 @@ class SchwabConfigManager:
 
         return params, underlying, environment
 
+    def _read_config_cache(self, stat: os.stat_result) -> Optional[dict]:
+        """Return the cached parse of config.yaml if it matches the file on disk"""
+        try:
+            cached = _json_loads(self._cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if cached.get("src") != [stat.st_mtime_ns, stat.st_size]:
+            return None
+        return cached.get("config")
+
+    def _write_config_cache(self, stat: os.stat_result, config: dict):
+        """Save the parsed config.yaml as JSON, which loads much faster than YAML"""
+        payload = {"src": [stat.st_mtime_ns, stat.st_size], "config": config}
+        try:
+            data = _json_dumps(payload)
+            if _json_loads(data) != payload:
+                raise ValueError("config does not round-trip through JSON")
+            self._cache_file.write_bytes(data)
+        except (OSError, TypeError, ValueError) as e:
+            # Unwritable dir, or values JSON can't hold as-is (YAML dates, int keys)
+            logger.debug(f"Config cache not written: {e}")
+            self._cache_file.unlink(missing_ok=True)
+
     def create_default_config(self, preset: str = "moderate"):
         """Create a default configuration file"""
         params = STRATEGY_PRESETS.get(preset, STRATEGY_PRESETS["moderate"])
@@ -291,12 +359,111 @@ class SchwabConfigManager:
         print(f"\nDefault configuration created at: {self.config_file}")
         print(f"Using '{preset}' strategy preset.")
 
-def perform_oauth_flow(client_id: str, redirect_uri: str = "https://127.0.0.1:8081") -> Optional[str]:
+
+@lru_cache(maxsize=8)
+def get_config_manager(config_dir: str = "~/.schwab_0dte_bot") -> SchwabConfigManager:
+    """Shared SchwabConfigManager per config directory"""
+    return SchwabConfigManager(config_dir)
+
+
+def _ensure_callback_cert(config_dir: Path) -> Tuple[Path, Path]:
+    """Create (once) a self-signed certificate for the local HTTPS callback"""
+    cert_file = config_dir / "callback_cert.pem"
+    key_file = config_dir / "callback_key.pem"
+    if cert_file.exists() and key_file.exists():
+        return cert_file, key_file
+
+    import datetime
+    import ipaddress
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=3650))
+        .add_extension(x509.SubjectAlternativeName([
+            x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+            x509.DNSName("localhost")
+        ]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    key_file.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+    key_file.chmod(0o600)
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+    return cert_file, key_file
+
+
+def _start_callback_server(redirect_uri: str, config_dir: Path) -> Optional[HTTPServer]:
+    """Listen on the local redirect URI in a background thread, if it is local"""
+    parsed = urlparse(redirect_uri)
+    if parsed.hostname not in ("127.0.0.1", "localhost") or not parsed.port:
+        return None
+
+    try:
+        server = HTTPServer((parsed.hostname, parsed.port), OAuthCallbackHandler)
+    except OSError as e:
+        print(f"\nCould not listen on port {parsed.port} ({e}).")
+        return None
+
+    try:
+        if parsed.scheme == "https":
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*_ensure_callback_cert(config_dir))
+            server.socket = context.wrap_socket(server.socket, server_side=True)
+    except (OSError, ValueError) as e:
+        print(f"\nCould not set up local HTTPS ({e}).")
+        server.server_close()
+        return None
+
+    server.auth_code = None
+    server.auth_error = None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _wait_for_callback(server: HTTPServer, timeout: float) -> Optional[str]:
+    """Wait for the callback server to capture a code (Ctrl+C gives up early)"""
+    deadline = time.monotonic() + timeout
+    try:
+        while server.auth_code is None and server.auth_error is None:
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.25)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if server.auth_error:
+        print(f"\nError: {server.auth_error}")
+    return server.auth_code
+
+
+def perform_oauth_flow(client_id: str, redirect_uri: str = "https://127.0.0.1:8081",
+                       config_dir: str = "~/.schwab_0dte_bot") -> Optional[str]:
     """
     Perform OAuth authorization flow to get authorization code
 
-    Note: Schwab requires HTTPS for callbacks. For local development,
-    you may need to use their provided callback URL or set up local HTTPS.
+    Note: Schwab requires HTTPS for callbacks. A local redirect URI is served
+    over HTTPS with a self-signed certificate kept in config_dir, so the
+    code is captured automatically; otherwise the redirect URL is pasted.
     """
     # Build authorization URL (no PKCE - matches working schwab_8081_fixed.py)
     auth_params = {
@@ -315,12 +482,29 @@ def perform_oauth_flow(client_id: str, redirect_uri: str = "https://127.0.0.1:80
     print("\nIf browser doesn't open, visit this URL manually:")
     print(f"\n{auth_url}\n")
 
+    # Start listening before the browser can redirect
+    server = _start_callback_server(redirect_uri, Path(config_dir).expanduser())
+
     # Try to open browser
     try:
         webbrowser.open(auth_url)
     except Exception:
         pass
 
+    if server:
+        print(f"\nWaiting for the redirect to {redirect_uri} ...")
+        print("(Accept the browser's warning about the self-signed certificate;")
+        print(" press Ctrl+C to paste the redirect URL manually instead)")
+
+        auth_code = _wait_for_callback(server, OAUTH_CALLBACK_TIMEOUT)
+        if auth_code:
+            print("\nAuthorization code captured successfully!")
+            return auth_code
+        if server.auth_error:
+            return None
+
+        print("\nNo redirect received.")
+
     print("\nAfter authorizing, you'll be redirected.")
     print("Copy the FULL redirect URL from your browser and paste it here.")
     print("\n(The URL will look like: https://127.0.0.1:8081?code=...)")
@@ -452,7 +636,7 @@ def setup_credentials_interactive():
 
     choice = input("\nSelection (1-2): ").strip() or "1"
 
-    config_mgr = SchwabConfigManager()
+    config_mgr = get_config_manager()
 
     if choice == "2":
         config_mgr.save_credentials_to_keyring(credentials)
@@ -497,7 +681,7 @@ def setup_credentials_interactive():
 
 def show_current_config():
     """Display current configuration"""
-    config_mgr = SchwabConfigManager()
+    config_mgr = get_config_manager()
 
     print("\n" + "="*60)
     print("  CURRENT CONFIGURATION")